@@ -6,23 +6,21 @@ with AI-powered insights and technical indicators.
 """
 
 import streamlit as st
-import pandas as pd
-import logging
-import os
-from datetime import datetime
-from dotenv import load_dotenv
-from agno.agent import Agent
+from concurrent.futures import ThreadPoolExecutor
+import time
 
 # Import modules
 from src.utils.logger import setup_logger
-from src.utils.constants import DEFAULT_COIN, TIMEFRAMES, DEFAULT_TIMEFRAME, GEMINI_API_KEY
-from src.utils.formatting import format_price, format_large_number
+from src.utils.constants import (
+    DEFAULT_COIN, TIMEFRAMES, GEMINI_API_KEY, INDICATOR_LOOKBACK, RERUN_SNAPSHOT_TTL,
+    PREFETCH_COINS
+)
 
-from src.data_processing.binance_api import get_coin_list, get_ticker_price, get_historical_klines
-from src.data_processing.market_data import get_market_data, update_market_data_cache
+from src.data_processing.binance_api import get_coin_list, get_coin_index, get_shared_historical_klines
+from src.data_processing.market_data import get_market_data, prefetch_top_coins
 
-from src.analytics.technical_indicators import calculate_binance_technical_indicators
-from src.analytics.ai_analysis import setup_ai_agent, generate_analysis_prompt, run_ai_analysis
+from src.analytics.technical_indicators import calculate_binance_technical_indicators_from_df
+from src.analytics.ai_analysis import setup_ai_agent, generate_analysis_prompt, run_cached_ai_analysis, analysis_cache_key
 
 from src.ui_components.styles import setup_page_style
 from src.ui_components.sidebar import setup_sidebar, display_coin_metrics
@@ -30,31 +28,33 @@ from src.ui_components.market_summary import display_market_summary
 from src.ui_components.analysis_display import display_analysis
 from src.ui_components.charts import display_volume_analysis
 
-# Load environment variables
-load_dotenv()
-
 # Setup logging
 logger = setup_logger()
 
+# Simplified analysis shown when the AI analysis fails
+FALLBACK_ANALYSIS_MARKDOWN = "### Technical Analysis\n\n**Signal:** {signal}"
+
 def main():
     """Main application function."""
     # Set up page configuration and styles
     setup_page_style()
     
     # Initialize session state
-    if 'market_data_cache' not in st.session_state:
-        st.session_state.market_data_cache = {}
-    
-    if 'last_update_time' not in st.session_state:
-        st.session_state.last_update_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if 'last_update_ts' not in st.session_state:
+        st.session_state.last_update_ts = time.time()
     
-    # Get coin list
+    # Get coin list and its lookup tables
     try:
         coins_list = get_coin_list()
+        coins_by_binance_symbol, coins_by_symbol = get_coin_index()
+        
+        # Warm the stats and klines for the most likely picks so the first view is served from cache
+        prefetch_top_coins(tuple(coin["binance_symbol"] for coin in coins_list[:PREFETCH_COINS]))
     except Exception as e:
-        logger.error(f"Error fetching coin list: {str(e)}")
+        logger.exception("Error fetching coin list: %s", e)
         st.error("Error fetching cryptocurrency list. Please try again later.")
         coins_list = []
+        coins_by_binance_symbol, coins_by_symbol = {}, {}
     
     # Setup sidebar and get user inputs
     coin_query, timeframe = setup_sidebar(coins_list)
@@ -73,36 +73,53 @@ def main():
     
     # Main content
     try:
-        # Get market data
-        coin_info = next((coin for coin in coins_list if coin["binance_symbol"].lower() == full_symbol), None)
+        # Look up the coin by trading pair, falling back to the base symbol
+        coin_info = coins_by_binance_symbol.get(full_symbol.lower()) or coins_by_symbol.get(coin_symbol.lower())
         
         if not coin_info:
-            # Try with just the symbol as fallback
-            coin_info = next((coin for coin in coins_list if coin["symbol"].lower() == coin_symbol.lower()), None)
+            st.warning(f"Cryptocurrency {coin_symbol} not found. Please try another symbol.")
+            return
+        
+        interval = TIMEFRAMES[timeframe]["interval"]
+        limit = TIMEFRAMES[timeframe]["limit"]
+        
+        # Reruns triggered by unrelated widgets reuse the data fetched for the
+        # same coin and timeframe within the current snapshot window
+        fingerprint = (coin_symbol, timeframe, int(time.time() // RERUN_SNAPSHOT_TTL))
+        agent_future = None
+        if st.session_state.get('last_fingerprint') == fingerprint:
+            stats, klines_data = st.session_state.fetched_data
+        else:
+            # Fetch market data and klines concurrently, since they are independent
+            # Binance requests. One klines fetch feeds both the indicators and the charts.
+            # On a cold start the AI agent is created alongside them.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                agent_future = executor.submit(setup_ai_agent, GEMINI_API_KEY)
+                stats_future = executor.submit(get_market_data, coin_symbol, coin_info)
+                klines_future = executor.submit(
+                    get_shared_historical_klines,
+                    full_symbol,
+                    interval,
+                    max(limit, INDICATOR_LOOKBACK)
+                )
+                stats = stats_future.result()
+                klines_data = klines_future.result()
             
-            if not coin_info:
-                st.warning(f"Cryptocurrency {coin_symbol} not found. Please try another symbol.")
-                return
+            st.session_state.fetched_data = (stats, klines_data)
+            st.session_state.last_fingerprint = fingerprint
         
-        # Get market data with caching
-        stats = get_market_data(coin_symbol, coin_info)
+        tech_indicators = calculate_binance_technical_indicators_from_df(klines_data.tail(INDICATOR_LOOKBACK), full_symbol)
+        historical_data = klines_data.tail(limit)
         
-        # Display market summary
-        display_market_summary(stats, coin_symbol, st.session_state.last_update_time)
+        # Only advance the update time when the market data was actually refetched
+        st.session_state.last_update_ts = stats.get('last_updated', st.session_state.last_update_ts)
         
-        # Calculate technical indicators
-        tech_indicators = calculate_binance_technical_indicators(full_symbol, TIMEFRAMES[timeframe]["interval"])
+        # Display market summary
+        display_market_summary(stats, coin_symbol, st.session_state.last_update_ts)
         
         # Display coin metrics in sidebar
         display_coin_metrics(stats, tech_indicators)
         
-        # Get historical data for charts
-        historical_data = get_historical_klines(
-            full_symbol, 
-            TIMEFRAMES[timeframe]["interval"], 
-            TIMEFRAMES[timeframe]["limit"]
-        )
-        
         # Determine technical signal
         tech_signal = "HOLD"  # Default
         
@@ -116,9 +133,9 @@ def main():
         elif rsi > 70 and macd < macd_signal:
             tech_signal = "SELL"
         
-        # Setup AI agent
+        # Setup AI agent (created once per process and shared across sessions)
         try:
-            agent = setup_ai_agent(GEMINI_API_KEY)
+            agent = agent_future.result() if agent_future is not None else setup_ai_agent(GEMINI_API_KEY)
             
             # Generate analysis prompt
             prompt = generate_analysis_prompt(
@@ -128,9 +145,10 @@ def main():
                 historical_data
             )
             
-            # Run AI analysis
+            # Run AI analysis (reused while the price and indicators barely move)
+            cache_key = analysis_cache_key(coin_symbol, timeframe, stats.get('price', 0.0), tech_indicators)
             with st.spinner("Generating AI analysis..."):
-                rec, rationale, factors, outlook, targets = run_ai_analysis(agent, prompt)
+                rec, rationale, factors, outlook, targets = run_cached_ai_analysis(agent, prompt, cache_key)
                 
                 # Display analysis
                 display_analysis(
@@ -147,12 +165,11 @@ def main():
                 )
         
         except Exception as e:
-            logger.error(f"Error in AI analysis: {str(e)}")
+            logger.exception("Error in AI analysis: %s", e)
             st.error(f"Error generating AI analysis: {str(e)}")
             
             # Display a simplified analysis without AI
-            st.markdown("### Technical Analysis")
-            st.markdown(f"**Signal:** {tech_signal}")
+            st.markdown(FALLBACK_ANALYSIS_MARKDOWN.format(signal=tech_signal))
             
             # Display basic chart
             if not historical_data.empty:
@@ -161,12 +178,15 @@ def main():
         # Volume Analysis Section
         st.markdown("## Volume Analysis")
         if not historical_data.empty:
-            display_volume_analysis(historical_data, coin_symbol)
+            display_volume_analysis(
+                historical_data['open'].to_numpy(), historical_data['close'].to_numpy(),
+                historical_data['volume'].to_numpy(), historical_data.index.to_numpy(), coin_symbol
+            )
         else:
             st.warning("No historical data available for volume analysis.")
     
     except Exception as e:
-        logger.error(f"Error in main application: {str(e)}")
+        logger.exception("Error in main application: %s", e)
         st.error(f"An error occurred: {str(e)}")
 
 if __name__ == "__main__":
@@ -2,12 +2,33 @@
 AI analysis functions for cryptocurrency data.
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 import re
 import os
+import streamlit as st
 from typing import Dict, Any, List, Tuple, Optional
-from dotenv import load_dotenv
+
+from src.utils.constants import CACHE_TTL
+
+# Patterns used to pull price targets out of the analysis text
+PRICE_PATTERN = re.compile(r'\$([0-9,.]+)')
+CONFIDENCE_PATTERN = re.compile(r'confidence: (\d+)%')
+
+# Closing instructions appended to every analysis prompt
+ANALYSIS_REQUEST = """
+    Based on this information, provide:
+    1. A trading recommendation (Buy, Sell, or Hold)
+    2. Rationale for the recommendation
+    3. Key market and technical factors
+    4. Market outlook
+    5. Price targets (support and resistance levels)
+    """
+
+# Price target descriptions by distance from the current price (<3%, <7%, further)
+SUPPORT_DESCRIPTIONS = ("Near-term support", "Medium-term support", "Long-term support")
+RESISTANCE_DESCRIPTIONS = ("Near-term resistance", "Medium-term resistance", "Long-term target")
 
 def analyze_with_ai(
     symbol: str, 
@@ -389,44 +410,35 @@ def extract_signal(recommendation: str) -> str:
 
 def enhance_ai_analysis(rec: str, rationale: str, factors: str, outlook: str, targets: str) -> Tuple[str, str, str, str, str]:
     """Enhance AI analysis results for more polished presentation."""
-    # Clean up any empty fields or None values
-    if rec is None or not rec or rec.strip() == "":
-        rec = "Hold"
-    
-    if rationale is None or not rationale or rationale.strip() == "":
-        rationale = "Analysis not available."
-    
-    if factors is None or not factors or factors.strip() == "":
-        factors = "No factor data available."
-    
-    if outlook is None or not outlook or outlook.strip() == "":
-        outlook = "Outlook data not available."
-    
-    if targets is None or not targets or targets.strip() == "":
-        targets = "No price targets available."
-    
-    # Ensure consistent formatting
-    rec = str(rec).strip()
-    rationale = str(rationale).strip()
-    factors = str(factors).strip()
-    outlook = str(outlook).strip()
-    targets = str(targets).strip()
+    # Clean up any empty fields or None values, stripping each field only once
+    rec = _clean_section(rec, "Hold")
+    rationale = _clean_section(rationale, "Analysis not available.")
+    factors = _clean_section(factors, "No factor data available.")
+    outlook = _clean_section(outlook, "Outlook data not available.")
+    targets = _clean_section(targets, "No price targets available.")
     
     return rec, rationale, factors, outlook, targets
 
+def _clean_section(text: Optional[str], default: str) -> str:
+    """Return the stripped text, or the default when it is None or blank."""
+    text = str(text).strip() if text else ""
+    return text or default
+
+@st.cache_resource(show_spinner=False)
 def setup_ai_agent(api_key=None):
     """
     Initialize and configure the AI agent for cryptocurrency analysis.
     
+    The agent is created once per process for each api_key and shared by all
+    sessions and reruns, so callers must not mutate it.
+    
     Args:
         api_key: API key for the AI service (optional)
         
     Returns:
         Agent or dict: Configuration for the AI agent
     """
-    # Load environment variables for API keys if needed
-    load_dotenv()
-    
+    # Environment variables are loaded once when src.utils.constants is imported
     # If no API key is provided, try to get it from environment variables
     if not api_key:
         api_key = os.getenv('OPENAI_API_KEY', None)
@@ -466,8 +478,29 @@ def generate_analysis_prompt(
     market_cap = stats.get('market_cap', 0.0)
     volume_24h = stats.get('volume_24h', 0.0)
     
-    # Create a basic prompt template
-    prompt = f"""
+    # Indicator lines, joined once instead of appended one by one
+    indicator_lines = "".join(
+        f"- {indicator}: {value:.4f}\n" if isinstance(value, float) else f"- {indicator}: {value}\n"
+        for indicator, value in indicators.items()
+    )
+    
+    # Add recent price action summary
+    performance = ""
+    if not historical_data.empty:
+        # Read each scalar once, reducing on the NumPy arrays rather than through pandas
+        first_close = historical_data['close'].iat[0]
+        recent_change = (current_price - first_close) / first_close * 100
+        high_max = historical_data['high'].to_numpy().max()
+        low_min = historical_data['low'].to_numpy().min()
+        
+        performance = (
+            f"\nRecent Performance:\n"
+            f"- Price change over period: {recent_change:.2f}%\n"
+            f"- Highest price: ${high_max:.2f}\n"
+            f"- Lowest price: ${low_min:.2f}\n"
+        )
+    
+    return f"""
     Analyze the cryptocurrency {symbol} with the following data:
     
     Current Price: ${current_price:.2f}
@@ -475,36 +508,7 @@ def generate_analysis_prompt(
     24h Volume: ${volume_24h:.2f}
     
     Technical Indicators:
-    """
-    
-    # Add technical indicators to the prompt
-    for indicator, value in indicators.items():
-        if isinstance(value, float):
-            prompt += f"- {indicator}: {value:.4f}\n"
-        else:
-            prompt += f"- {indicator}: {value}\n"
-    
-    # Add recent price action summary
-    if not historical_data.empty:
-        recent_change = ((current_price - historical_data['close'].iloc[0]) / 
-                         historical_data['close'].iloc[0] * 100)
-        
-        prompt += f"\nRecent Performance:\n"
-        prompt += f"- Price change over period: {recent_change:.2f}%\n"
-        prompt += f"- Highest price: ${historical_data['high'].max():.2f}\n"
-        prompt += f"- Lowest price: ${historical_data['low'].min():.2f}\n"
-    
-    # Add analysis request
-    prompt += """
-    Based on this information, provide:
-    1. A trading recommendation (Buy, Sell, or Hold)
-    2. Rationale for the recommendation
-    3. Key market and technical factors
-    4. Market outlook
-    5. Price targets (support and resistance levels)
-    """
-    
-    return prompt
+    {indicator_lines}{performance}{ANALYSIS_REQUEST}"""
 
 def run_ai_analysis(
     agent: Any,
@@ -568,96 +572,87 @@ def run_ai_analysis(
     
     return recommendation, rationale, factors, outlook, targets
 
+def analysis_cache_key(symbol: str, timeframe: str, current_price: float, indicators: Dict[str, float]) -> str:
+    """
+    Build a coarse cache key for the AI analysis.
+    
+    The analysis is written for one timeframe, so the timeframe is part of the key.
+    The price is kept to 4 significant figures and RSI to one decimal, with only the
+    direction of the MACD crossover, so small price ticks reuse the previous analysis.
+    """
+    rsi = indicators.get('rsi', 50)
+    bullish_macd = indicators.get('macd', 0) > indicators.get('macd_signal', 0)
+    return f"{symbol}:{timeframe}:{current_price:.4g}:{rsi:.1f}:{bullish_macd}"
+
+def run_cached_ai_analysis(agent: Any, prompt: str, cache_key: Optional[str] = None) -> Tuple[str, str, str, str, str]:
+    """
+    Run AI analysis, reusing the result for an identical prompt.
+    
+    The prompt already encodes the symbol, price and indicators, so its
+    SHA-256 digest is used as the cache key unless a coarser cache_key
+    (see analysis_cache_key) is given.
+    """
+    if cache_key is None:
+        cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return _run_cached_ai_analysis(cache_key, agent, prompt)
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _run_cached_ai_analysis(cache_key: str, _agent: Any, _prompt: str) -> Tuple[str, str, str, str, str]:
+    """Cached wrapper around run_ai_analysis keyed only by cache_key."""
+    return run_ai_analysis(_agent, _prompt)
+
+def _parse_price(text: str) -> float:
+    """Parse a matched price like '1,234.5', returning NaN when it is malformed."""
+    try:
+        return float(text.replace(',', ''))
+    except ValueError:
+        return np.nan
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=128, show_spinner=False)
 def extract_price_targets(targets_text: str, current_price: float) -> pd.DataFrame:
-    """Extract price targets from text into structured DataFrame."""
+    """Extract price targets from text into structured DataFrame; cached per (text, price)."""
     try:
         if not targets_text or targets_text is None or "no data" in str(targets_text).lower():
             return pd.DataFrame()
         
-        # Initialize lists for data
-        data = []
-        
-        # Regular expressions to find price patterns
-        price_pattern = r'\$([0-9,.]+)'
-        confidence_pattern = r'confidence: (\d+)%'
-        
         # Find all prices in the text
-        prices = re.findall(price_pattern, str(targets_text))
+        prices = PRICE_PATTERN.findall(str(targets_text))
         if not prices:
             # If no prices found, return empty DataFrame
             return pd.DataFrame()
             
-        # Convert prices to float, handling potential format issues
-        cleaned_prices = []
-        for price in prices:
-            try:
-                cleaned_prices.append(float(price.replace(',', '')))
-            except (ValueError, AttributeError):
-                continue
-        
-        prices = cleaned_prices
-        if not prices:
+        # Convert prices to a float array, dropping entries that fail to parse
+        prices = np.fromiter((_parse_price(price) for price in prices), dtype=np.float64, count=len(prices))
+        prices = prices[np.isfinite(prices)]
+        if prices.size == 0:
             # If no valid prices, return empty DataFrame
             return pd.DataFrame()
         
-        # Find all confidence levels
-        confidences = re.findall(confidence_pattern, str(targets_text))
-        cleaned_confidences = []
-        for conf in confidences:
-            try:
-                cleaned_confidences.append(int(conf))
-            except (ValueError, AttributeError):
-                continue
-        
-        confidences = cleaned_confidences
-        
-        # If we don't have enough confidence values, fill with defaults
-        while len(confidences) < len(prices):
-            confidences.append(70)  # Default confidence
-        
-        # Determine if each price is support or resistance
-        for i, price in enumerate(prices):
-            confidence = confidences[i] if i < len(confidences) else 70
-            
-            try:
-                if price < current_price:
-                    price_type = "Support"
-                    # Generate description based on distance from current price
-                    difference = abs(current_price - price) / current_price * 100
-                    if difference < 3:
-                        description = "Near-term support"
-                    elif difference < 7:
-                        description = "Medium-term support"
-                    else:
-                        description = "Long-term support"
-                else:
-                    price_type = "Resistance"
-                    # Generate description based on distance from current price
-                    difference = abs(price - current_price) / current_price * 100
-                    if difference < 3:
-                        description = "Near-term resistance"
-                    elif difference < 7:
-                        description = "Medium-term resistance"
-                    else:
-                        description = "Long-term target"
-                
-                data.append({
-                    "price": price,
-                    "confidence": confidence,
-                    "type": price_type,
-                    "description": description
-                })
-            except Exception as e:
-                import logging
-                logging.error(f"Error processing price target: {e}")
-                continue
-        
-        # If we couldn't extract any valid data, return empty DataFrame
-        if not data:
-            return pd.DataFrame()
-            
-        # Convert to DataFrame and sort by price
-        df = pd.DataFrame(data)
+        # Find all confidence levels, filling missing ones with the default
+        confidences = np.full(prices.size, 70, dtype=np.int64)
+        parsed_confidences = [int(conf) for conf in CONFIDENCE_PATTERN.findall(str(targets_text))][:prices.size]
+        confidences[:len(parsed_confidences)] = parsed_confidences
+        
+        # Classify every price as support or resistance by its distance from the current price
+        is_support = prices < current_price
+        difference = np.abs(prices - current_price) / current_price * 100
+        horizon = np.select([difference < 3, difference < 7], [0, 1], default=2)
+        descriptions = np.where(
+            is_support,
+            np.array(SUPPORT_DESCRIPTIONS)[horizon],
+            np.array(RESISTANCE_DESCRIPTIONS)[horizon]
+        )
+        
+        df = pd.DataFrame({
+            "price": prices,
+            # Display label for the targets table, formatted once here since the result is cached
+            "price_label": np.char.mod("$%.4f", prices),
+            "confidence": confidences,
+            "type": np.where(is_support, "Support", "Resistance"),
+            "description": descriptions
+        })
+        
+        # Sort by price
         df = df.sort_values("price", ascending=False)
         
         return df
@@ -0,0 +1,98 @@
+"""
+Compiled indicator kernels for the Crypto Analysis Pro Dashboard.
+
+The kernels operate on float64 close-price arrays and are JIT-compiled with
+numba when it is installed; otherwise they run as plain Python loops.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def rsi_value(avg_gain: float, avg_loss: float) -> float:
+    """Return the RSI for Wilder-smoothed average gain and loss; flat prices read 50."""
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True)
+def indicators_last(close: np.ndarray, rsi_period: int = 14, fast: int = 12, slow: int = 26, signal: int = 9):
+    """Return the latest (rsi, macd, macd_signal, ema_fast, ema_slow) in one pass over ``close``."""
+    n = close.shape[0]
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_signal = 2.0 / (signal + 1.0)
+
+    ema_fast = close[0]
+    ema_slow = close[0]
+    macd_signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        # MACD: adjust=False EMAs of the close and of their difference
+        ema_fast = alpha_fast * close[i] + (1.0 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * close[i] + (1.0 - alpha_slow) * ema_slow
+        macd_signal = alpha_signal * (ema_fast - ema_slow) + (1.0 - alpha_signal) * macd_signal
+
+        # RSI: simple mean over the first period, Wilder's smoothing afterwards
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= rsi_period:
+            avg_gain += gain / rsi_period
+            avg_loss += loss / rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+
+    rsi = 50.0 if n <= rsi_period else rsi_value(avg_gain, avg_loss)
+
+    return rsi, ema_fast - ema_slow, macd_signal, ema_fast, ema_slow
+
+
+@njit(cache=True)
+def ema_series(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Return the adjust=False exponential moving average of ``x`` seeded with ``x[0]``."""
+    out = np.empty_like(x)
+    if x.shape[0] == 0:
+        return out
+    out[0] = x[0]
+    for i in range(1, x.shape[0]):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True)
+def rsi_series(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Return Wilder's RSI of ``close``, defined exactly as in ``indicators_last``.
+
+    The average gain and loss start as the simple mean of the first ``period``
+    changes and are Wilder-smoothed afterwards; the first ``period`` entries are NaN.
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if i <= period:
+            avg_gain += gain / period
+            avg_loss += loss / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if i >= period:
+            out[i] = rsi_value(avg_gain, avg_loss)
+    return out
@@ -79,11 +79,17 @@ def get_technical_signal(indicators: Dict[str, float]) -> str:
                 bullish += 1
             total_signals += 1
 
+        # Fetch each indicator once; missing ones come back as None
+        macd = indicators.get('macd')
+        signal = indicators.get('macd_signal')
+        ema50 = indicators.get('ema50')
+        ema200 = indicators.get('ema200')
+        price = indicators.get('price')
+        percent_b = indicators.get('bb_percentB')
+        momentum = indicators.get('momentum_1w')
+
         # Check MACD
-        if 'macd' in indicators and 'macd_signal' in indicators:
-            macd = indicators['macd']
-            signal = indicators['macd_signal']
-            
+        if macd is not None and signal is not None:
             if macd > signal:
                 bullish += 1
                 if macd > 0 and signal > 0:
@@ -96,10 +102,7 @@ def get_technical_signal(indicators: Dict[str, float]) -> str:
                 total_signals += 2
         
         # Check EMA crossovers
-        if 'ema50' in indicators and 'ema200' in indicators:
-            ema50 = indicators['ema50']
-            ema200 = indicators['ema200']
-            
+        if ema50 is not None and ema200 is not None:
             if ema50 > ema200:
                 bullish += 2  # Golden cross situation
                 total_signals += 2
@@ -108,10 +111,7 @@ def get_technical_signal(indicators: Dict[str, float]) -> str:
                 total_signals += 2
         
         # Check price vs EMAs
-        if 'price' in indicators and 'ema50' in indicators:
-            price = indicators['price']
-            ema50 = indicators['ema50']
-            
+        if price is not None and ema50 is not None:
             if price > ema50:
                 bullish += 1  # Price above short-term trend
                 total_signals += 1
@@ -120,9 +120,7 @@ def get_technical_signal(indicators: Dict[str, float]) -> str:
                 total_signals += 1
         
         # Check Bollinger Bands
-        if 'bb_percentB' in indicators:
-            percent_b = indicators['bb_percentB']
-            
+        if percent_b is not None:
             if percent_b < 0.2:
                 bullish += 1  # Near lower band - potential bounce
                 total_signals += 1
@@ -131,15 +129,13 @@ def get_technical_signal(indicators: Dict[str, float]) -> str:
                 total_signals += 1
         
         # Check momentum
-        if 'momentum_1w' in indicators:
-            momentum = indicators['momentum_1w']
-            if momentum is not None:
-                if momentum > 5:
-                    bullish += 1  # Strong upward momentum
-                    total_signals += 1
-                elif momentum < -5:
-                    bearish += 1  # Strong downward momentum
-                    total_signals += 1
+        if momentum is not None:
+            if momentum > 5:
+                bullish += 1  # Strong upward momentum
+                total_signals += 1
+            elif momentum < -5:
+                bearish += 1  # Strong downward momentum
+                total_signals += 1
         
         # Safe calculation of final signal
         if total_signals == 0:
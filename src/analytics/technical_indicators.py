@@ -2,22 +2,47 @@
 Technical indicators calculation for the Crypto Analysis Pro Dashboard.
 """
 
+import time
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional
+import streamlit as st
+from typing import Dict, Any, List, Optional, Tuple
 import traceback
 
 from src.utils.logger import logger
-from src.utils.constants import DEFAULT_SIGNAL
-from src.data_processing.binance_api import get_binance_klines
+from src.utils.constants import DEFAULT_SIGNAL, CACHE_TTL, INTERVAL_SECONDS
+from src.data_processing.binance_api import get_live_klines
+from src.analytics.indicator_kernels import indicators_last, ema_series, rsi_series
 
 def calculate_binance_technical_indicators(symbol: str, interval: str = "1d", limit: int = 50) -> Dict[str, float]:
     """Calculate technical indicators using Binance kline data."""
+    # A new candle starts a new cache entry right away; within a candle the
+    # CACHE_TTL expiry refreshes the values of the still-forming candle
+    bucket = int(time.time() // INTERVAL_SECONDS.get(interval, CACHE_TTL))
+    return _calculate_binance_technical_indicators(symbol, interval, limit, bucket)
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _calculate_binance_technical_indicators(symbol: str, interval: str, limit: int, bucket: int) -> Dict[str, float]:
+    """Compute Binance technical indicators; cached per (symbol, interval, limit, candle bucket)."""
     try:
-        # Get kline data
-        klines = get_binance_klines(symbol, interval, limit)
-        
-        if not klines:
+        # Only the close prices are needed, so skip building a DataFrame
+        klines = get_live_klines(symbol, interval, limit)
+        close = np.fromiter((float(k[4]) for k in klines), dtype=np.float64, count=len(klines))
+    except Exception as e:
+        logger.error(f"Error fetching klines for {symbol}: {str(e)}")
+        close = np.empty(0, dtype=np.float64)
+    return calculate_binance_technical_indicators_from_close(close, symbol)
+
+def calculate_binance_technical_indicators_from_df(df: pd.DataFrame, symbol: str = "") -> Dict[str, float]:
+    """Calculate RSI, MACD and EMA values from an already fetched klines DataFrame."""
+    if df.empty:
+        return calculate_binance_technical_indicators_from_close(np.empty(0, dtype=np.float64), symbol)
+    return calculate_binance_technical_indicators_from_close(df['close'].to_numpy(dtype=np.float64), symbol)
+
+def calculate_binance_technical_indicators_from_close(close: np.ndarray, symbol: str = "") -> Dict[str, float]:
+    """Calculate RSI, MACD and EMA values from a float64 array of close prices."""
+    try:
+        if close.size == 0:
             return {
                 'rsi': 50,
                 'macd': 0,
@@ -26,42 +51,10 @@ def calculate_binance_technical_indicators(symbol: str, interval: str = "1d", li
                 'ema_slow': 0
             }
         
-        # Convert to dataframe
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Convert types
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = df[col].astype(float)
-        
-        # Calculate RSI
-        delta = df['close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        # Calculate EMAs
-        ema_fast = df['close'].ewm(span=12, adjust=False).mean()
-        ema_slow = df['close'].ewm(span=26, adjust=False).mean()
-        
-        # Calculate MACD
-        macd = ema_fast - ema_slow
-        macd_signal = macd.ewm(span=9, adjust=False).mean()
-        
-        # Get the latest values
-        latest_rsi = rsi.iloc[-1]
-        latest_macd = macd.iloc[-1]
-        latest_macd_signal = macd_signal.iloc[-1]
-        latest_ema_fast = ema_fast.iloc[-1]
-        latest_ema_slow = ema_slow.iloc[-1]
+        # Calculate RSI, EMAs and MACD in a single compiled pass
+        latest_rsi, latest_macd, latest_macd_signal, latest_ema_fast, latest_ema_slow = indicators_last(
+            close, 14, 12, 26, 9
+        )
         
         return {
             'rsi': latest_rsi,
@@ -82,8 +75,24 @@ def calculate_binance_technical_indicators(symbol: str, interval: str = "1d", li
             'ema_slow': 0
         }
 
-def calculate_technical_indicators(df: pd.DataFrame, selected_indicators: List[str] = None) -> pd.DataFrame:
-    """Calculate additional technical indicators for analysis."""
+def calculate_technical_indicators(df: pd.DataFrame, selected_indicators: List[str] = None,
+                                   cache_key: Optional[str] = None) -> pd.DataFrame:
+    """Calculate additional technical indicators for analysis.
+    
+    When a cache_key identifying the data is given (e.g. f"{symbol}:{timeframe}:{last_open_time}"),
+    the result is cached on that key so Streamlit never hashes the DataFrame itself.
+    """
+    if cache_key is not None and not df.empty:
+        return _cached_technical_indicators(cache_key, tuple(selected_indicators or ()), df)
+    return _compute_technical_indicators(df, selected_indicators)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=64, show_spinner=False)
+def _cached_technical_indicators(cache_key: str, selected_indicators: Tuple[str, ...], _df: pd.DataFrame) -> pd.DataFrame:
+    """Cached indicator calculation; the leading underscore keeps _df out of the cache key."""
+    return _compute_technical_indicators(_df, list(selected_indicators))
+
+def _compute_technical_indicators(df: pd.DataFrame, selected_indicators: List[str] = None) -> pd.DataFrame:
+    """Compute the selected indicator columns on a copy of df."""
     if df.empty:
         return df
     
@@ -95,30 +104,33 @@ def calculate_technical_indicators(df: pd.DataFrame, selected_indicators: List[s
     result_df = df.copy()
     
     try:
+        # RSI, EMA and MACD run on the raw close array through the indicator kernels
+        close = result_df['close'].to_numpy(dtype=np.float64)
+        
         # RSI (Relative Strength Index)
         if 'rsi' in selected_indicators:
-            delta = result_df['close'].diff()
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
-            
-            avg_gain = gain.rolling(window=14).mean()
-            avg_loss = loss.rolling(window=14).mean()
-            
-            rs = avg_gain / avg_loss
-            result_df['rsi'] = 100 - (100 / (1 + rs))
+            # Same Wilder RSI definition as the sidebar value from indicators_last
+            result_df['rsi'] = rsi_series(close, 14)
+        
+        # The 12/26 EMAs feed both the EMA columns and MACD, so compute them once
+        if 'ema' in selected_indicators or 'macd' in selected_indicators:
+            ema12 = ema_series(close, 2 / 13)
+            ema26 = ema_series(close, 2 / 27)
         
         # EMA (Exponential Moving Average)
         if 'ema' in selected_indicators:
-            result_df['ema12'] = result_df['close'].ewm(span=12, adjust=False).mean()
-            result_df['ema26'] = result_df['close'].ewm(span=26, adjust=False).mean()
-            result_df['ema50'] = result_df['close'].ewm(span=50, adjust=False).mean()
-            result_df['ema200'] = result_df['close'].ewm(span=200, adjust=False).mean()
+            result_df['ema12'] = ema12
+            result_df['ema26'] = ema26
+            result_df['ema50'] = ema_series(close, 2 / 51)
+            result_df['ema200'] = ema_series(close, 2 / 201)
         
         # MACD (Moving Average Convergence Divergence)
         if 'macd' in selected_indicators:
-            result_df['macd'] = result_df['close'].ewm(span=12, adjust=False).mean() - result_df['close'].ewm(span=26, adjust=False).mean()
-            result_df['macd_signal'] = result_df['macd'].ewm(span=9, adjust=False).mean()
-            result_df['macd_histogram'] = result_df['macd'] - result_df['macd_signal']
+            macd = ema12 - ema26
+            macd_signal = ema_series(macd, 2 / 10)
+            result_df['macd'] = macd
+            result_df['macd_signal'] = macd_signal
+            result_df['macd_histogram'] = macd - macd_signal
         
         # Bollinger Bands
         if 'bollinger' in selected_indicators:
@@ -4,10 +4,10 @@ Main dashboard application for the Crypto Analysis Pro dashboard.
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime
 from typing import Dict, Any, List, Tuple
 import time
 import traceback
+from urllib.parse import quote
 
 from src.data.coin_data import get_coin_data, get_historical_data
 from src.analytics.technical_analysis import perform_technical_analysis, get_technical_signal
@@ -19,6 +19,10 @@ from src.ui_components.analysis_display import display_analysis
 from src.ui_components.charts import create_candlestick_chart, display_volume_analysis
 from src.utils.constants import TIMEFRAMES
 
+# Timeframe button colors for the selected and the other timeframes
+TIMEFRAME_BUTTON_ACTIVE_STYLE = "background-color: #3B82F6; color: white;"
+TIMEFRAME_BUTTON_STYLE = "background-color: #374151; color: #E5E7EB;"
+
 def main():
     """Main function to run the Crypto Analysis Pro dashboard."""
     # Set up page style with modern UI
@@ -125,8 +129,7 @@ def display_coin_analysis(symbol: str, timeframe: str):
         return
     
     # Display market summary
-    update_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    display_market_summary(coin_data, symbol, update_time)
+    display_market_summary(coin_data, symbol, time.time())
     
     # Fetch historical data
     historical_data = get_historical_data(symbol, timeframe)
@@ -174,18 +177,21 @@ def display_coin_analysis(symbol: str, timeframe: str):
         # Display timeframe selection
         timeframe_options = list(TIMEFRAMES.keys())
         
-        # Build the HTML string for timeframe buttons
-        buttons_html = []
-        for tf in timeframe_options:
-            active_class = "active" if tf == timeframe else ""
-            active_style = "background-color: #3B82F6; color: white;" if tf == timeframe else "background-color: #374151; color: #E5E7EB;"
-            button_html = f'<button style="{active_style} margin-right: 0.5rem; padding: 0.5rem 1rem; border: none; border-radius: 0.25rem; cursor: pointer; font-weight: 500; transition: all 0.2s ease;" onclick="window.location.href=\'?coin_query={symbol}&timeframe={tf}\'">{TIMEFRAMES[tf]["label"]}</button>'
-            buttons_html.append(button_html)
+        # Build the HTML string for timeframe buttons. The symbol is URL-encoded once,
+        # which also keeps quotes and angle brackets out of the onclick handler
+        query_symbol = quote(symbol)
+        buttons_html = "".join(
+            f'<button style="{TIMEFRAME_BUTTON_ACTIVE_STYLE if tf == timeframe else TIMEFRAME_BUTTON_STYLE} '
+            f'margin-right: 0.5rem; padding: 0.5rem 1rem; border: none; border-radius: 0.25rem; cursor: pointer; '
+            f'font-weight: 500; transition: all 0.2s ease;" '
+            f'onclick="window.location.href=\'?coin_query={query_symbol}&timeframe={tf}\'">{TIMEFRAMES[tf]["label"]}</button>'
+            for tf in timeframe_options
+        )
         
         st.markdown(
             f"""
             <div style="display: flex; flex-wrap: wrap; margin-bottom: 1rem;">
-                {"".join(buttons_html)}
+                {buttons_html}
             </div>
             """,
             unsafe_allow_html=True
@@ -216,7 +222,10 @@ def display_coin_analysis(symbol: str, timeframe: str):
         """, unsafe_allow_html=True)
         
         with st.spinner("Analyzing trading volume patterns..."):
-            display_volume_analysis(historical_data, symbol)
+            display_volume_analysis(
+                historical_data['open'].to_numpy(), historical_data['close'].to_numpy(),
+                historical_data['volume'].to_numpy(), historical_data.index.to_numpy(), symbol
+            )
         
         st.markdown('</div>', unsafe_allow_html=True)
 
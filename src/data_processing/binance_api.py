@@ -2,81 +2,215 @@
 Binance API integration for the Crypto Analysis Pro Dashboard.
 """
 
+import os
+import json
+import pickle
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 import traceback
 
-from src.utils.constants import BINANCE_BASE_URL, CACHE_TTL, MAX_COINS, TIMEFRAMES, DEFAULT_TIMEFRAME
+from src.utils.constants import (
+    BINANCE_BASE_URL, PRICE_CACHE_TTL, MAX_COINS, TIMEFRAMES, DEFAULT_TIMEFRAME,
+    COIN_LIST_TTL, COIN_LIST_DISK_TTL, COIN_LIST_RETRY_DELAY, COIN_LIST_CACHE_FILE, BINANCE_TIMEOUT,
+    DEFAULT_PRICE, DEFAULT_VOLUME, DEFAULT_MARKET_CAP, DEFAULT_MOOD, DEFAULT_BUZZ
+)
+from src.data_processing.ws_cache import get_streamed_klines, is_streaming_available, subscribe_klines
 from src.utils.logger import logger
 
-# --- In-memory cache for market data ---
-market_data_cache: Dict[str, Dict[str, Any]] = {}
-binance_symbols_cache: List[str] = []
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
 
-@st.cache_data(ttl=CACHE_TTL)
-def get_coin_list() -> List[Dict[str, str]]:
-    """Return a list of supported coins from Binance."""
+# Column layout of the Binance /api/v3/klines response
+KLINE_COLUMNS = [
+    'timestamp', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'quote_asset_volume', 'number_of_trades',
+    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+]
+
+# Fields kept from the Binance /api/v3/ticker/24hr response
+TICKER_24H_DTYPES = {
+    'symbol': str, 'lastPrice': np.float64, 'volume': np.float64,
+    'quoteVolume': np.float64, 'priceChangePercent': np.float64, 'count': np.int64
+}
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode a Binance JSON response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+@st.cache_resource(show_spinner=False)
+def get_binance_session() -> requests.Session:
+    """Return a shared HTTP session so Binance requests reuse pooled keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    return session
+
+def load_cached_coin_list() -> Optional[Tuple[List[Dict[str, Any]], float]]:
+    """Load the coin list persisted on disk, with its save time, if it is recent enough."""
+    try:
+        if not os.path.exists(COIN_LIST_CACHE_FILE):
+            return None
+        saved_at = os.path.getmtime(COIN_LIST_CACHE_FILE)
+        if time.time() - saved_at > COIN_LIST_DISK_TTL:
+            return None
+        with open(COIN_LIST_CACHE_FILE, "rb") as f:
+            coins = pickle.load(f)
+        logger.info(f"Loaded {len(coins)} coins from disk cache")
+        return coins, saved_at
+    except Exception as e:
+        logger.warning(f"Failed to load coin list from disk cache: {str(e)}")
+        return None
+
+def save_cached_coin_list(coins: List[Dict[str, Any]]) -> None:
+    """Persist the coin list on disk so a restarted app can skip the network."""
     try:
-        # Get binance symbols for direct data access
-        binance_symbols = get_binance_symbols()
-        global binance_symbols_cache
-        binance_symbols_cache = [s.upper() for s in binance_symbols]
+        os.makedirs(os.path.dirname(COIN_LIST_CACHE_FILE), exist_ok=True)
+        with open(COIN_LIST_CACHE_FILE, "wb") as f:
+            pickle.dump(coins, f)
+    except Exception as e:
+        logger.warning(f"Failed to save coin list to disk cache: {str(e)}")
 
-        # Get ticker price data for all symbols
-        ticker_data = get_binance_ticker_prices()
+# Hardcoded coin list with realistic prices, used when Binance is unreachable
+FALLBACK_COINS: List[Dict[str, Any]] = [
+    {"id": "binance-btc", "symbol": "btc", "name": "Bitcoin", "name_lower": "bitcoin", "binance_symbol": "BTCUSDT", "is_on_binance": True, "price": 65432.10},
+    {"id": "binance-eth", "symbol": "eth", "name": "Ethereum", "name_lower": "ethereum", "binance_symbol": "ETHUSDT", "is_on_binance": True, "price": 3245.75},
+    {"id": "binance-bnb", "symbol": "bnb", "name": "Binance Coin", "name_lower": "binance coin", "binance_symbol": "BNBUSDT", "is_on_binance": True, "price": 578.32},
+    {"id": "binance-sol", "symbol": "sol", "name": "Solana", "name_lower": "solana", "binance_symbol": "SOLUSDT", "is_on_binance": True, "price": 142.87},
+    {"id": "binance-xrp", "symbol": "xrp", "name": "Ripple", "name_lower": "ripple", "binance_symbol": "XRPUSDT", "is_on_binance": True, "price": 0.5423},
+    {"id": "binance-ada", "symbol": "ada", "name": "Cardano", "name_lower": "cardano", "binance_symbol": "ADAUSDT", "is_on_binance": True, "price": 0.4587},
+    {"id": "binance-doge", "symbol": "doge", "name": "Dogecoin", "name_lower": "dogecoin", "binance_symbol": "DOGEUSDT", "is_on_binance": True, "price": 0.1234},
+    {"id": "binance-dot", "symbol": "dot", "name": "Polkadot", "name_lower": "polkadot", "binance_symbol": "DOTUSDT", "is_on_binance": True, "price": 6.789},
+    {"id": "binance-avax", "symbol": "avax", "name": "Avalanche", "name_lower": "avalanche", "binance_symbol": "AVAXUSDT", "is_on_binance": True, "price": 34.56},
+    {"id": "binance-shib", "symbol": "shib", "name": "Shiba Inu", "name_lower": "shiba inu", "binance_symbol": "SHIBUSDT", "is_on_binance": True, "price": 0.00002345}
+]
 
-        # Create coins list with USDT pairs only
-        coins = []
+@st.cache_resource(show_spinner=False)
+def get_coin_list_state() -> Dict[str, Any]:
+    """Return the process-wide coin list state shared by every session."""
+    return {
+        "coins": None, "index": None, "last_refresh": 0.0, "retry_at": 0.0, "refreshing": False,
+        "lock": threading.Lock()
+    }
+
+def fetch_coin_list() -> List[Dict[str, Any]]:
+    """Build the coin list from Binance and persist it on disk; raises on failure."""
+    # One 24h ticker request carries the last price and trade count of every pair
+    tickers = get_binance_24h_tickers()
+
+    # Keep actively traded USDT pairs with a valid price, highest priced MAX_COINS first
+    tickers = tickers[
+        tickers['symbol'].str.endswith('USDT') & (tickers['lastPrice'] > 0) & (tickers['count'] > 0)
+    ].nlargest(MAX_COINS, 'lastPrice')
 
-        for symbol, price_info in ticker_data.items():
-            if symbol.endswith('USDT'):
-                base_symbol = symbol[:-4].lower()  # Remove USDT suffix
-                name = base_symbol.capitalize()  # Use capitalized symbol as name
-
-                # Create a unique ID (needed for cache keys)
-                coin_id = f"binance-{base_symbol}"
-
-                # Add coin to the list
-                coins.append({
-                    "id": coin_id,
-                    "symbol": base_symbol,
-                    "name": name,
-                    "binance_symbol": symbol,
-                    "is_on_binance": True,
-                    "price": float(price_info.get('price', 0))
-                })
-
-        # Sort by name
-        coins.sort(key=lambda x: float(x.get('price', 0)), reverse=True)
-
-        logger.info(f"Retrieved {len(coins)} coins from Binance")
-        return coins[:MAX_COINS]  # Return top MAX_COINS coins
+    base_symbols = tickers['symbol'].str[:-4].str.lower()  # Remove USDT suffix
+    coins = pd.DataFrame({
+        "id": "binance-" + base_symbols,  # Unique ID (needed for cache keys)
+        "symbol": base_symbols,
+        "name": base_symbols.str.capitalize(),  # Use capitalized symbol as name
+        "name_lower": base_symbols,  # Normalized name for lookups
+        "binance_symbol": tickers['symbol'],
+        "is_on_binance": True,
+        "price": tickers['lastPrice']
+    }).to_dict('records')
+
+    logger.info(f"Retrieved {len(coins)} coins from Binance")
+
+    # Only persist real Binance data, never the hardcoded fallback
+    if coins:
+        save_cached_coin_list(coins)
+    return coins
+
+def refresh_coin_list(state: Dict[str, Any]) -> None:
+    """Refetch the coin list, keeping the current list and scheduling a retry on failure."""
+    try:
+        coins = fetch_coin_list()
     except Exception as e:
-        logger.error(f"Failed to obtain coin list: {str(e)}")
-        # Fallback to a more comprehensive hardcoded list with realistic prices
-        return [
-            {"id": "binance-btc", "symbol": "btc", "name": "Bitcoin", "binance_symbol": "BTCUSDT", "is_on_binance": True, "price": 65432.10},
-            {"id": "binance-eth", "symbol": "eth", "name": "Ethereum", "binance_symbol": "ETHUSDT", "is_on_binance": True, "price": 3245.75},
-            {"id": "binance-bnb", "symbol": "bnb", "name": "Binance Coin", "binance_symbol": "BNBUSDT", "is_on_binance": True, "price": 578.32},
-            {"id": "binance-sol", "symbol": "sol", "name": "Solana", "binance_symbol": "SOLUSDT", "is_on_binance": True, "price": 142.87},
-            {"id": "binance-xrp", "symbol": "xrp", "name": "Ripple", "binance_symbol": "XRPUSDT", "is_on_binance": True, "price": 0.5423},
-            {"id": "binance-ada", "symbol": "ada", "name": "Cardano", "binance_symbol": "ADAUSDT", "is_on_binance": True, "price": 0.4587},
-            {"id": "binance-doge", "symbol": "doge", "name": "Dogecoin", "binance_symbol": "DOGEUSDT", "is_on_binance": True, "price": 0.1234},
-            {"id": "binance-dot", "symbol": "dot", "name": "Polkadot", "binance_symbol": "DOTUSDT", "is_on_binance": True, "price": 6.789},
-            {"id": "binance-avax", "symbol": "avax", "name": "Avalanche", "binance_symbol": "AVAXUSDT", "is_on_binance": True, "price": 34.56},
-            {"id": "binance-shib", "symbol": "shib", "name": "Shiba Inu", "binance_symbol": "SHIBUSDT", "is_on_binance": True, "price": 0.00002345}
-        ]
-
-@st.cache_data(ttl=CACHE_TTL)
+        logger.error(f"Failed to refresh coin list: {str(e)}")
+        coins = []
+    with state["lock"]:
+        if coins:
+            state["coins"] = coins
+            state["index"] = None
+            state["last_refresh"] = time.time()
+        else:
+            state["retry_at"] = time.time() + COIN_LIST_RETRY_DELAY
+        state["refreshing"] = False
+
+def get_coin_list() -> List[Dict[str, str]]:
+    """Return a list of supported coins from Binance.
+    
+    The last known list is served immediately; once it is older than
+    COIN_LIST_TTL a background refresh is started and later calls pick it up.
+    The network is never called while holding the state lock. When Binance
+    cannot be reached, FALLBACK_COINS is served and the fetch is retried in
+    the background every COIN_LIST_RETRY_DELAY seconds.
+    """
+    state = get_coin_list_state()
+    with state["lock"]:
+        if state["coins"] is None:
+            # Reuse the coin list from a previous process when it is still fresh
+            cached = load_cached_coin_list()
+            if cached:
+                state["coins"], state["last_refresh"] = cached
+
+        if state["coins"] is not None:
+            now = time.time()
+            stale = now - state["last_refresh"] > COIN_LIST_TTL and now >= state["retry_at"]
+            if stale and not state["refreshing"]:
+                state["refreshing"] = True
+                threading.Thread(target=refresh_coin_list, args=(state,), name="coin-list-refresh", daemon=True).start()
+            return state["coins"]
+
+        # Cold start: one session fetches, the others get the fallback list meanwhile
+        if state["refreshing"]:
+            return FALLBACK_COINS
+        state["refreshing"] = True
+
+    refresh_coin_list(state)
+    with state["lock"]:
+        if state["coins"] is None:
+            state["coins"] = FALLBACK_COINS
+        return state["coins"]
+
+def get_coin_index() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Return coin lookup tables keyed by lowercase Binance pair and base symbol."""
+    coins = get_coin_list()
+    state = get_coin_list_state()
+    with state["lock"]:
+        index = state["index"]
+        if index is not None and index[0] is coins:
+            return index[1], index[2]
+
+    by_binance_symbol = {coin["binance_symbol"].lower(): coin for coin in coins}
+    by_symbol = {coin["symbol"].lower(): coin for coin in coins}
+    with state["lock"]:
+        # Skip the store when a refresh swapped the list in the meantime
+        if coins is state["coins"]:
+            state["index"] = (coins, by_binance_symbol, by_symbol)
+    return by_binance_symbol, by_symbol
+
+@st.cache_data(ttl=COIN_LIST_TTL)  # Listed pairs change rarely
 def get_binance_symbols() -> List[str]:
     """Get all tradable symbols from Binance with USDT pairs."""
     try:
-        response = requests.get(f"{BINANCE_BASE_URL}/api/v3/exchangeInfo")
+        response = get_binance_session().get(f"{BINANCE_BASE_URL}/api/v3/exchangeInfo", timeout=BINANCE_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
 
         # Extract USDT trading pairs
         usdt_symbols = []
@@ -90,13 +224,13 @@ def get_binance_symbols() -> List[str]:
         logger.error(f"Failed to get Binance symbols: {str(e)}")
         return []
 
-@st.cache_data(ttl=60)  # Shorter cache for price data
+@st.cache_data(ttl=PRICE_CACHE_TTL)  # Shorter cache for price data
 def get_binance_ticker_prices() -> Dict[str, Dict[str, Any]]:
     """Get ticker price data for all symbols."""
     try:
-        response = requests.get(f"{BINANCE_BASE_URL}/api/v3/ticker/price")
+        response = get_binance_session().get(f"{BINANCE_BASE_URL}/api/v3/ticker/price", timeout=BINANCE_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
 
         # Convert to dictionary for easier lookup
         return {item['symbol']: {'price': item['price']} for item in data}
@@ -104,53 +238,75 @@ def get_binance_ticker_prices() -> Dict[str, Dict[str, Any]]:
         logger.error(f"Failed to get Binance ticker prices: {str(e)}")
         return {}
 
-@st.cache_data(ttl=60)  # Shorter cache for price data
+@st.cache_data(ttl=PRICE_CACHE_TTL, show_spinner=False)  # Shorter cache for price data
+def get_binance_24h_tickers() -> pd.DataFrame:
+    """Get 24-hour ticker statistics for all symbols in a single request."""
+    try:
+        response = get_binance_session().get(f"{BINANCE_BASE_URL}/api/v3/ticker/24hr", timeout=BINANCE_TIMEOUT)
+        response.raise_for_status()
+        tickers = pd.DataFrame(decode_json(response), columns=list(TICKER_24H_DTYPES))
+    except Exception as e:
+        logger.error(f"Failed to get Binance 24h tickers: {str(e)}")
+        tickers = pd.DataFrame(columns=list(TICKER_24H_DTYPES))
+    return tickers.astype(TICKER_24H_DTYPES)
+
+@st.cache_data(ttl=PRICE_CACHE_TTL)  # Shorter cache for price data
 def get_ticker_price(symbol: str) -> float:
     """Get current price for a specific symbol."""
     try:
-        response = requests.get(f"{BINANCE_BASE_URL}/api/v3/ticker/price", params={"symbol": symbol})
+        response = get_binance_session().get(
+            f"{BINANCE_BASE_URL}/api/v3/ticker/price", params={"symbol": symbol}, timeout=BINANCE_TIMEOUT
+        )
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
         return float(data.get('price', 0))
     except Exception as e:
         logger.error(f"Failed to get ticker price for {symbol}: {str(e)}")
         return 0.0
 
-def get_binance_ticker_data(symbol: str) -> Dict[str, Any]:
-    """Get detailed ticker data from Binance."""
-    try:
-        response = requests.get(f"{BINANCE_BASE_URL}/api/v3/ticker/24hr", params={"symbol": symbol})
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        logger.error(f"Failed to get Binance ticker data for {symbol}: {str(e)}")
-        return {}
-
-def get_binance_24h_stats(symbol: str) -> Dict[str, Any]:
-    """Get 24-hour statistics from Binance."""
+@st.cache_data(ttl=PRICE_CACHE_TTL, show_spinner=False)  # Shorter cache for price data
+def get_binance_24h_stats(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Get 24-hour statistics for one or more symbols in a single Binance request.
+    
+    Args:
+        symbols: Trading pair symbols (e.g. ['BTCUSDT', 'ETHUSDT'])
+        
+    Returns:
+        Dict of 24h stats keyed by uppercase symbol, or empty dict if request fails
+    """
     try:
-        response = requests.get(f"{BINANCE_BASE_URL}/api/v3/ticker/24hr", params={"symbol": symbol})
+        formatted_symbols = [symbol.upper() for symbol in symbols]
+        response = get_binance_session().get(
+            f"{BINANCE_BASE_URL}/api/v3/ticker/24hr",
+            params={"symbols": json.dumps(formatted_symbols, separators=(",", ":"))},
+            timeout=BINANCE_TIMEOUT
+        )
         response.raise_for_status()
-        data = response.json()
-        
-        # Calculate additional metrics
-        result = {
-            "volume": float(data.get("volume", 0)),
-            "quoteVolume": float(data.get("quoteVolume", 0)),
-            "priceChangePercent": float(data.get("priceChangePercent", 0)),
-        }
-        
-        # Calculate volume change percent (not provided directly by API)
-        # This is a placeholder calculation
-        result["volumeChangePercent"] = float(data.get("priceChangePercent", 0)) * 2
         
-        return result
+        stats = {}
+        for data in decode_json(response):
+            price_change_pct = float(data.get("priceChangePercent", 0))
+            stats[data["symbol"]] = {
+                "lastPrice": float(data.get("lastPrice", 0)),
+                "volume": float(data.get("volume", 0)),
+                "quoteVolume": float(data.get("quoteVolume", 0)),
+                "priceChangePercent": price_change_pct,
+                # Volume change percent is not provided directly by the API;
+                # this is a placeholder calculation
+                "volumeChangePercent": price_change_pct * 2,
+            }
+        return stats
     except Exception as e:
-        logger.error(f"Failed to get Binance 24h stats for {symbol}: {str(e)}")
+        logger.error(f"Failed to get Binance 24h stats for {symbols}: {str(e)}")
         return {}
 
+@st.cache_data(ttl=PRICE_CACHE_TTL, max_entries=256, show_spinner=False)
 def get_binance_klines(symbol: str, interval: str, limit: int) -> List[List]:
-    """Get kline (candlestick) data from Binance.
+    """Get kline (candlestick) data from Binance, cached for PRICE_CACHE_TTL."""
+    return fetch_binance_klines(symbol, interval, limit)
+
+def fetch_binance_klines(symbol: str, interval: str, limit: int) -> List[List]:
+    """Get kline (candlestick) data from Binance, bypassing the cache.
     
     Args:
         symbol: Trading pair symbol (e.g. 'btcusdt')
@@ -164,45 +320,63 @@ def get_binance_klines(symbol: str, interval: str, limit: int) -> List[List]:
         # Binance API requires uppercase symbols
         formatted_symbol = symbol.upper()
         
-        response = requests.get(
+        response = get_binance_session().get(
             f"{BINANCE_BASE_URL}/api/v3/klines",
-            params={"symbol": formatted_symbol, "interval": interval, "limit": limit}
+            params={"symbol": formatted_symbol, "interval": interval, "limit": limit},
+            timeout=BINANCE_TIMEOUT
         )
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
     except Exception as e:
         logger.error(f"Failed to get Binance klines for {symbol}: {str(e)}")
         return []
 
+def klines_to_dataframe(klines: List[List]) -> pd.DataFrame:
+    """Convert raw Binance klines into an OHLCV DataFrame indexed by open time.
+    
+    Only the OHLCV fields the dashboard reads are parsed, into one contiguous
+    float64 block, so column reads such as df['close'].to_numpy() do not copy.
+    """
+    values = np.array([k[1:6] for k in klines], dtype=np.float64)
+    open_times = np.fromiter((k[0] for k in klines), dtype=np.int64, count=len(klines))
+    index = pd.DatetimeIndex(pd.to_datetime(open_times, unit='ms'), name='timestamp')
+    return pd.DataFrame(values, index=index, columns=KLINE_COLUMNS[1:6])
+
+def get_live_klines(symbol: str, interval: str, limit: int) -> List[List]:
+    """Get raw klines, served from the live stream buffer when it covers the request."""
+    klines = get_streamed_klines(symbol, interval, limit)
+    if klines is None:
+        if not is_streaming_available():
+            return get_binance_klines(symbol, interval, limit)
+        # Seed a new stream from a fresh request; cached klines can be a minute behind it
+        klines = fetch_binance_klines(symbol, interval, limit)
+        subscribe_klines(symbol, interval, klines)
+    return klines
+
 def get_historical_klines(symbol: str, interval: str, limit: int) -> pd.DataFrame:
     """Get historical klines data and convert to DataFrame."""
     try:
-        klines = get_binance_klines(symbol, interval, limit)
+        klines = get_live_klines(symbol, interval, limit)
         
         if not klines:
             logger.warning(f"No kline data returned from Binance for {symbol}")
             return pd.DataFrame()
             
-        # Convert to DataFrame
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Convert types
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = df[col].astype(float)
-        
-        # Set timestamp as index
-        df.set_index('timestamp', inplace=True)
-        
-        return df
+        return klines_to_dataframe(klines)
     except Exception as e:
         logger.error(f"Error getting historical klines for {symbol}: {str(e)}")
         return pd.DataFrame()
 
+@st.cache_resource(ttl=PRICE_CACHE_TTL, max_entries=64, show_spinner=False)
+def get_shared_historical_klines(symbol: str, interval: str, limit: int) -> pd.DataFrame:
+    """
+    Get the klines DataFrame shared by reference across reruns and sessions.
+    
+    Unlike st.cache_data this returns the same object instead of a copy on every hit,
+    so callers must not mutate it (take .tail() or .copy() first).
+    """
+    return get_historical_klines(symbol, interval, limit)
+
 def get_historical_data(coin_info: Dict[str, Any], timeframe: str = DEFAULT_TIMEFRAME) -> Dict[str, Any]:
     """Get historical price data with Binance API."""
     try:
@@ -224,22 +398,7 @@ def get_historical_data(coin_info: Dict[str, Any], timeframe: str = DEFAULT_TIME
             if not klines:
                 return {"success": False, "message": "No historical data available"}
             
-            # Convert to dataframe
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
-            
-            # Convert types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-            
-            # Set timestamp as index
-            df.set_index('timestamp', inplace=True)
-            
-            return {"success": True, "data": df}
+            return {"success": True, "data": klines_to_dataframe(klines)}
         else:
             return {"success": False, "message": "Coin not available on Binance"}
             
@@ -266,8 +425,7 @@ def get_default_market_data(coin_id: str) -> Dict[str, Any]:
             "macd_signal": 120.8,
             "ema_fast": 65400.0,
             "ema_slow": 64200.0,
-            "price_change_pct": 2.3,
-            "last_updated": datetime.utcnow().isoformat()
+            "price_change_pct": 2.3
         }
     elif symbol == 'ETH':
         return {
@@ -281,8 +439,7 @@ def get_default_market_data(coin_id: str) -> Dict[str, Any]:
             "macd_signal": 18.2,
             "ema_fast": 3240.0,
             "ema_slow": 3180.0,
-            "price_change_pct": 3.1,
-            "last_updated": datetime.utcnow().isoformat()
+            "price_change_pct": 3.1
         }
     else:
         return {
@@ -296,6 +453,5 @@ def get_default_market_data(coin_id: str) -> Dict[str, Any]:
             "macd_signal": 0.0,
             "ema_fast": 0.0,
             "ema_slow": 0.0,
-            "price_change_pct": 0.0,
-            "last_updated": datetime.utcnow().isoformat()
+            "price_change_pct": 0.0
         }
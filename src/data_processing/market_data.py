@@ -2,137 +2,176 @@
 Market data processing for the Crypto Analysis Pro Dashboard.
 """
 
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+import time
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import traceback
 
-from src.utils.constants import DEFAULT_PRICE, DEFAULT_VOLUME, DEFAULT_MARKET_CAP, DEFAULT_MOOD, DEFAULT_BUZZ, CACHE_TTL
+from src.utils.constants import (
+    DEFAULT_PRICE, DEFAULT_VOLUME, DEFAULT_MARKET_CAP, DEFAULT_MOOD, DEFAULT_BUZZ, PRICE_CACHE_TTL,
+    MARKET_DATA_STALE_TTL, TIMEFRAMES, INDICATOR_LOOKBACK, PREFETCH_COINS
+)
 from src.utils.logger import logger
 from src.data_processing.binance_api import (
-    get_binance_ticker_data, 
     get_binance_24h_stats, 
-    get_default_market_data
+    get_coin_list,
+    get_default_market_data,
+    get_binance_klines
 )
 from src.analytics.technical_indicators import calculate_binance_technical_indicators
 
-# --- In-memory cache for market data ---
-market_data_cache: Dict[str, Dict[str, Any]] = {}
+@st.cache_resource(show_spinner=False)
+def get_market_data_executor() -> ThreadPoolExecutor:
+    """Return a shared thread pool for running independent Binance requests concurrently."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="market-data")
+
+@st.cache_resource(show_spinner=False)
+def prefetch_top_coins(binance_symbols: Tuple[str, ...]) -> bool:
+    """Warm the market data caches for the given pairs in the background, once per process.
+    
+    The pairs get the batched 24h stats request fetch_market_data makes for the
+    top coins, and each pair gets the daily candles used by get_market_data and
+    the candles main() requests for the default (first) timeframe.
+    
+    Only the cached REST klines are warmed. Kline streams are opened by
+    get_live_klines for the coin being viewed, so the prefetch does not use up
+    the KLINE_STREAM_MAX_STREAMS slots.
+    """
+    default_timeframe = TIMEFRAMES[next(iter(TIMEFRAMES))]
+    requests_to_warm = [
+        ("1d", INDICATOR_LOOKBACK),
+        (default_timeframe["interval"], max(default_timeframe["limit"], INDICATOR_LOOKBACK))
+    ]
+    executor = get_market_data_executor()
+    if binance_symbols:
+        executor.submit(get_binance_24h_stats, list(binance_symbols))
+    for binance_symbol in binance_symbols:
+        for interval, limit in requests_to_warm:
+            executor.submit(get_binance_klines, binance_symbol, interval, limit)
+    return True
+
+@st.cache_resource(show_spinner=False)
+def get_last_good_market_data() -> Dict[str, Tuple[Dict[str, Any], float]]:
+    """Return the process-wide (market data, fetch time) of the last successful fetch per coin."""
+    return {}
 
 def get_market_data(coin_id: str, coin_info: Dict[str, Any]) -> Dict[str, Any]:
-    """Get market data for a specific coin using Binance API."""
+    """Get market data for a specific coin using Binance API.
+    
+    When Binance fails, the last good data for the coin is served for up to
+    MARKET_DATA_STALE_TTL seconds before falling back to the defaults.
+    """
+    last_good = get_last_good_market_data()
     try:
-        # Check cache first
-        if coin_id in market_data_cache:
-            cached_data = market_data_cache[coin_id]
-            last_updated = datetime.fromisoformat(cached_data.get('last_updated', ''))
-            if (datetime.utcnow() - last_updated).total_seconds() < CACHE_TTL:
-                logger.info(f"Using cached data for {coin_id}")
-                return cached_data
-
-        # For Binance coins
-        if coin_info.get('is_on_binance'):
-            binance_symbol = coin_info.get('binance_symbol')
-
-            # Get detailed ticker data
-            binance_data = get_binance_ticker_data(binance_symbol)
-
-            # Get 24-hour stats
-            stats_24h = get_binance_24h_stats(binance_symbol)
-
-            # Initialize result
-            result = {
-                "price": float(binance_data.get('lastPrice', coin_info.get('price', DEFAULT_PRICE))),
-                "volume": float(stats_24h.get('volume', DEFAULT_VOLUME)),
-                "cap": float(stats_24h.get('quoteVolume', DEFAULT_VOLUME * 10)),  # Use quote volume as proxy
-                "last_updated": datetime.utcnow().isoformat()
-            }
-
-            # Price change percentage
-            price_change_pct = float(stats_24h.get('priceChangePercent', 0))
-            result["price_change_pct"] = price_change_pct
-
-            # Get detailed technical indicators
-            tech_indicators = calculate_binance_technical_indicators(binance_symbol, "1d", 50)
-
-            # Add technical indicators
-            result.update({
-                "rsi_d1": tech_indicators.get('rsi', 50),
-                "macd": tech_indicators.get('macd', 0),
-                "macd_signal": tech_indicators.get('macd_signal', 0),
-                "ema_fast": tech_indicators.get('ema_fast', 0),
-                "ema_slow": tech_indicators.get('ema_slow', 0)
-            })
-
-            # Set market mood based on indicators
-            if price_change_pct > 5 or (tech_indicators.get('rsi', 50) > 65 and price_change_pct > 2):
-                result["mood"] = "Bullish"
-            elif price_change_pct < -5 or (tech_indicators.get('rsi', 50) < 35 and price_change_pct < -2):
-                result["mood"] = "Bearish"
-            else:
-                result["mood"] = "Neutral"
-
-            # Determine social buzz based on volume
-            volume_change_percent = float(stats_24h.get('volumeChangePercent', 0))
-            if volume_change_percent > 50:
-                result["buzz"] = "High"
-            elif volume_change_percent > 10:
-                result["buzz"] = "Moderate"
-            else:
-                result["buzz"] = "Low"
-
-            # Update cache
-            market_data_cache[coin_id] = result
-            return result
-        else:
-            # Fallback for non-Binance coins (shouldn't happen with new implementation)
-            return get_default_market_data(coin_id)
-
+        market_data = fetch_market_data(coin_id, coin_info)
+        last_good[coin_id] = (market_data, time.time())
+        return market_data
     except Exception as e:
         logger.error(f"Error getting market data for {coin_id}: {str(e)}")
         logger.error(traceback.format_exc())
+        stale = last_good.get(coin_id)
+        if stale is not None and time.time() - stale[1] <= MARKET_DATA_STALE_TTL:
+            logger.warning(f"Serving market data for {coin_id} from {int(time.time() - stale[1])}s ago")
+            # Flag the data so the market summary can show that it may be outdated
+            return {**stale[0], "stale": True}
+        return get_default_market_data(coin_id)
+
+@st.cache_data(ttl=PRICE_CACHE_TTL, max_entries=128, show_spinner=False)
+def fetch_market_data(coin_id: str, _coin_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch market data for a coin, cached per coin_id; errors propagate so they are not cached."""
+    # For Binance coins
+    if _coin_info.get('is_on_binance'):
+        binance_symbol = _coin_info.get('binance_symbol')
+
+        # The top coins share one batched 24h stats request, so switching between
+        # them within PRICE_CACHE_TTL is served from the same cache entry
+        top_symbols = [coin["binance_symbol"] for coin in get_coin_list()[:PREFETCH_COINS]]
+        stats_symbols = top_symbols if binance_symbol in top_symbols else [binance_symbol]
+
+        # Fetch 24-hour stats (which also carry the last traded price) and
+        # the daily technical indicators concurrently
+        executor = get_market_data_executor()
+        stats_future = executor.submit(get_binance_24h_stats, stats_symbols)
+        tech_future = executor.submit(calculate_binance_technical_indicators, binance_symbol, "1d", 50)
+        stats_24h = stats_future.result().get(binance_symbol.upper())
+        if not stats_24h and len(stats_symbols) > 1:
+            # One delisted pair fails the whole batch, so retry this coin on its own
+            stats_24h = get_binance_24h_stats([binance_symbol]).get(binance_symbol.upper())
+        if not stats_24h:
+            # Raise rather than cache placeholder values for the whole PRICE_CACHE_TTL
+            raise RuntimeError(f"No 24h stats returned for {binance_symbol}")
+
+        # Initialize result
+        result = {
+            "price": float(stats_24h.get('lastPrice', _coin_info.get('price', DEFAULT_PRICE))),
+            "volume": float(stats_24h.get('volume', DEFAULT_VOLUME)),
+            "cap": float(stats_24h.get('quoteVolume', DEFAULT_VOLUME * 10)),  # Use quote volume as proxy
+            "last_updated": time.time()  # Epoch seconds, formatted only when displayed
+        }
+
+        # Price change percentage
+        price_change_pct = float(stats_24h.get('priceChangePercent', 0))
+        result["price_change_pct"] = price_change_pct
+
+        # Get detailed technical indicators
+        tech_indicators = tech_future.result()
+
+        # Add technical indicators
+        result.update({
+            "rsi_d1": tech_indicators.get('rsi', 50),
+            "macd": tech_indicators.get('macd', 0),
+            "macd_signal": tech_indicators.get('macd_signal', 0),
+            "ema_fast": tech_indicators.get('ema_fast', 0),
+            "ema_slow": tech_indicators.get('ema_slow', 0)
+        })
+
+        # Set market mood based on indicators
+        if price_change_pct > 5 or (tech_indicators.get('rsi', 50) > 65 and price_change_pct > 2):
+            result["mood"] = "Bullish"
+        elif price_change_pct < -5 or (tech_indicators.get('rsi', 50) < 35 and price_change_pct < -2):
+            result["mood"] = "Bearish"
+        else:
+            result["mood"] = "Neutral"
+
+        # Determine social buzz based on volume
+        volume_change_percent = float(stats_24h.get('volumeChangePercent', 0))
+        if volume_change_percent > 50:
+            result["buzz"] = "High"
+        elif volume_change_percent > 10:
+            result["buzz"] = "Moderate"
+        else:
+            result["buzz"] = "Low"
+
+        return result
+    else:
+        # Fallback for non-Binance coins (shouldn't happen with new implementation)
         return get_default_market_data(coin_id)
 
 def lookup_coin(query: str, coins: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
-    """Find a coin by symbol or name."""
+    """Find a coin by symbol or name.
+    
+    Matches are ranked exact symbol, exact name, partial symbol, then partial
+    name, and all four are classified in a single pass over the coins.
+    """
     if not query or not coins:
         return None
     
     # Normalize query
     query = query.strip().lower()
-
-def update_market_data_cache(coin_id: str, data: Dict[str, Any]) -> None:
-    """Update the market data cache for a specific coin."""
-    try:
-        # Add timestamp if not present
-        if 'last_updated' not in data:
-            data['last_updated'] = datetime.utcnow().isoformat()
-            
-        # Update the cache
-        market_data_cache[coin_id] = data
-        logger.info(f"Updated market data cache for {coin_id}")
-    except Exception as e:
-        logger.error(f"Error updating market data cache for {coin_id}: {str(e)}")
-        logger.error(traceback.format_exc())
-    
-    # First try exact symbol match
-    for coin in coins:
-        if coin.get('symbol', '').lower() == query:
-            return coin
-    
-    # Then try exact name match
-    for coin in coins:
-        if coin.get('name', '').lower() == query:
-            return coin
-    
-    # Then try partial symbol match
-    for coin in coins:
-        if query in coin.get('symbol', '').lower():
-            return coin
     
-    # Then try partial name match
+    exact_name = partial_symbol = partial_name = None
     for coin in coins:
-        if query in coin.get('name', '').lower():
+        symbol = coin.get('symbol', '').lower()
+        if symbol == query:
             return coin
+        
+        name = coin.get('name_lower') or coin.get('name', '').lower()
+        if exact_name is None and name == query:
+            exact_name = coin
+        elif partial_symbol is None and query in symbol:
+            partial_symbol = coin
+        elif partial_name is None and query in name:
+            partial_name = coin
     
-    # No match found
-    return None
+    return exact_name or partial_symbol or partial_name
@@ -0,0 +1,194 @@
+"""
+Live kline cache fed by the Binance WebSocket API for the Crypto Analysis Pro Dashboard.
+
+Each (symbol, interval) pair is seeded once from REST and then kept current by a
+background thread subscribed to the matching ``<symbol>@kline_<interval>`` stream.
+At most KLINE_STREAM_MAX_STREAMS streams are open at a time; the least recently
+read one is closed to make room, streams nobody read for
+KLINE_STREAM_IDLE_TIMEOUT seconds close themselves, and a stream whose last
+KLINE_STREAM_MAX_RETRIES connection attempts all failed is given up.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.constants import (
+    BINANCE_WS_URL, KLINE_STREAM_MAX_AGE, KLINE_STREAM_MAX_STREAMS, KLINE_STREAM_IDLE_TIMEOUT,
+    KLINE_STREAM_MAX_RETRIES, KLINE_STREAM_RETRY_DELAY
+)
+from src.utils.logger import logger
+
+try:
+    import websocket  # provided by the websocket-client package
+except ImportError:  # streaming is optional; callers fall back to REST
+    websocket = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    json_loads = json.loads
+
+# --- Rolling kline buffers keyed by (symbol, interval) ---
+kline_cache: Dict[Tuple[str, str], List[list]] = {}
+kline_cache_size: Dict[Tuple[str, str], int] = {}
+kline_last_update: Dict[Tuple[str, str], float] = {}
+kline_last_read: Dict[Tuple[str, str], float] = {}
+kline_streams: Dict[Tuple[str, str], threading.Thread] = {}
+kline_ws_apps: Dict[Tuple[str, str], "websocket.WebSocketApp"] = {}
+_kline_lock = threading.Lock()
+
+def is_streaming_available() -> bool:
+    """Return True when the WebSocket client library is installed."""
+    return websocket is not None
+
+def get_streamed_klines(symbol: str, interval: str, limit: int) -> Optional[List[list]]:
+    """Return the latest ``limit`` klines from the live buffer, or None on a miss."""
+    key = (symbol.lower(), interval)
+    with _kline_lock:
+        klines = kline_cache.get(key)
+        if not klines or len(klines) < limit:
+            return None
+        if time.time() - kline_last_update.get(key, 0) > KLINE_STREAM_MAX_AGE:
+            return None
+        kline_last_read[key] = time.time()
+        return [list(k) for k in klines[-limit:]]
+
+def subscribe_klines(symbol: str, interval: str, seed_klines: List[list]) -> None:
+    """Seed the buffer with REST klines and start streaming updates for the pair.
+
+    ``seed_klines`` should come from a fresh REST request rather than a cached one,
+    so the buffer does not start behind the stream.
+    """
+    if websocket is None or not seed_klines:
+        return
+
+    key = (symbol.lower(), interval)
+    evicted = None
+    with _kline_lock:
+        now = time.time()
+        kline_cache[key] = [list(k) for k in seed_klines]
+        kline_cache_size[key] = max(len(seed_klines), kline_cache_size.get(key, 0))
+        kline_last_update[key] = now
+        kline_last_read[key] = now
+
+        thread = kline_streams.get(key)
+        if thread is not None and thread.is_alive():
+            return
+
+        # Make room by closing the stream that was read least recently
+        if len(kline_streams) >= KLINE_STREAM_MAX_STREAMS:
+            lru_key = min(kline_streams, key=lambda k: kline_last_read.get(k, 0))
+            evicted = kline_ws_apps.get(lru_key)
+            _drop_stream(lru_key)
+
+        thread = threading.Thread(
+            target=_run_ws, args=(key,), name=f"kline-{key[0]}-{interval}", daemon=True
+        )
+        kline_streams[key] = thread
+
+    if evicted is not None:
+        evicted.close()
+    thread.start()
+
+def _drop_stream(key: Tuple[str, str]) -> None:
+    """Forget a stream and its buffer; the caller holds _kline_lock."""
+    kline_streams.pop(key, None)
+    kline_ws_apps.pop(key, None)
+    kline_cache.pop(key, None)
+    kline_cache_size.pop(key, None)
+    kline_last_update.pop(key, None)
+    kline_last_read.pop(key, None)
+
+def _is_idle(key: Tuple[str, str]) -> bool:
+    """Return True when nobody read the stream within KLINE_STREAM_IDLE_TIMEOUT."""
+    with _kline_lock:
+        last_read = kline_last_read.get(key)
+    return last_read is None or time.time() - last_read > KLINE_STREAM_IDLE_TIMEOUT
+
+def _owns_stream(key: Tuple[str, str]) -> bool:
+    """Return True while the current thread is the registered stream for the pair."""
+    with _kline_lock:
+        return kline_streams.get(key) is threading.current_thread()
+
+def _run_ws(key: Tuple[str, str]) -> None:
+    """Keep a WebSocket connection open for one kline stream, reconnecting on drops."""
+    symbol, interval = key
+    url = f"{BINANCE_WS_URL}/stream?streams={symbol}@kline_{interval}"
+    failures = 0
+
+    def close_if_idle(ws) -> bool:
+        # run_forever stops after close(), and the loop below does not reconnect idle streams
+        if _is_idle(key):
+            ws.close()
+            return True
+        return False
+
+    def on_open(ws):
+        nonlocal failures
+        failures = 0
+
+    def on_message(ws, message):
+        if close_if_idle(ws):
+            return
+        try:
+            _apply_kline_event(key, json_loads(message).get("data", {}))
+        except Exception as e:
+            logger.error(f"Error parsing kline stream message for {symbol}: {str(e)}")
+
+    def on_pong(ws, data):
+        # Pongs arrive every ping interval, so quiet streams are checked too
+        close_if_idle(ws)
+
+    def on_error(ws, error):
+        logger.warning(f"Kline stream error for {symbol}@{interval}: {str(error)}")
+
+    try:
+        while not _is_idle(key):
+            ws_app = websocket.WebSocketApp(
+                url, on_open=on_open, on_message=on_message, on_pong=on_pong, on_error=on_error
+            )
+            with _kline_lock:
+                if kline_streams.get(key) is not threading.current_thread():
+                    return  # Evicted before the connection was opened
+                kline_ws_apps[key] = ws_app
+            ws_app.run_forever(ping_interval=60, ping_timeout=10)
+
+            # on_open resets the count, so only consecutive failed connections add up
+            failures += 1
+            if not _owns_stream(key) or _is_idle(key):
+                return
+            if failures >= KLINE_STREAM_MAX_RETRIES:
+                logger.warning(f"Kline stream for {symbol}@{interval} gave up after {failures} failed connections")
+                return
+            time.sleep(KLINE_STREAM_RETRY_DELAY)
+    except Exception as e:
+        logger.error(f"Kline stream for {symbol}@{interval} stopped: {str(e)}")
+    finally:
+        with _kline_lock:
+            # A newer subscription for the same pair owns the entries from now on
+            if kline_streams.get(key) is threading.current_thread():
+                _drop_stream(key)
+
+def _apply_kline_event(key: Tuple[str, str], event: dict) -> None:
+    """Merge one kline event into the rolling buffer in REST column order."""
+    k = event.get("k")
+    if not k:
+        return
+
+    row = [
+        k["t"], k["o"], k["h"], k["l"], k["c"], k["v"],
+        k["T"], k["q"], k["n"], k["V"], k["Q"], k["B"]
+    ]
+    with _kline_lock:
+        klines = kline_cache.get(key)
+        if klines is None:
+            return
+        if klines and klines[-1][0] == row[0]:
+            # Update to the candle that is still open
+            klines[-1] = row
+        elif not klines or row[0] > klines[-1][0]:
+            klines.append(row)
+            del klines[:-kline_cache_size[key]]
+        kline_last_update[key] = time.time()
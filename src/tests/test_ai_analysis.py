@@ -0,0 +1,39 @@
+"""
+Checks of the coarse AI analysis cache key.
+"""
+
+from src.analytics.ai_analysis import analysis_cache_key
+
+INDICATORS = {"rsi": 55.04, "macd": 1.5, "macd_signal": 1.0}
+
+
+def test_timeframe_is_part_of_the_key():
+    assert analysis_cache_key("BTC", "1D", 65000.0, INDICATORS) != analysis_cache_key("BTC", "4H", 65000.0, INDICATORS)
+
+
+def test_symbol_is_part_of_the_key():
+    assert analysis_cache_key("BTC", "1D", 65000.0, INDICATORS) != analysis_cache_key("ETH", "1D", 65000.0, INDICATORS)
+
+
+def test_small_price_ticks_share_a_key():
+    # Prices are kept to 4 significant figures
+    assert analysis_cache_key("BTC", "1D", 65001.0, INDICATORS) == analysis_cache_key("BTC", "1D", 64996.0, INDICATORS)
+    assert analysis_cache_key("BTC", "1D", 65000.0, INDICATORS) != analysis_cache_key("BTC", "1D", 65100.0, INDICATORS)
+
+
+def test_rsi_is_rounded_to_one_decimal():
+    nudged = dict(INDICATORS, rsi=55.01)
+    moved = dict(INDICATORS, rsi=55.2)
+    assert analysis_cache_key("BTC", "1D", 65000.0, nudged) == analysis_cache_key("BTC", "1D", 65000.0, INDICATORS)
+    assert analysis_cache_key("BTC", "1D", 65000.0, moved) != analysis_cache_key("BTC", "1D", 65000.0, INDICATORS)
+
+
+def test_only_macd_direction_matters():
+    wider = dict(INDICATORS, macd=3.0)
+    crossed = dict(INDICATORS, macd=0.5)
+    assert analysis_cache_key("BTC", "1D", 65000.0, wider) == analysis_cache_key("BTC", "1D", 65000.0, INDICATORS)
+    assert analysis_cache_key("BTC", "1D", 65000.0, crossed) != analysis_cache_key("BTC", "1D", 65000.0, INDICATORS)
+
+
+def test_missing_indicators_use_neutral_defaults():
+    assert analysis_cache_key("BTC", "1D", 65000.0, {}) == "BTC:1D:6.5e+04:50.0:False"
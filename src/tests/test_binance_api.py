@@ -0,0 +1,97 @@
+"""
+Checks of the Binance API fallbacks and the coin list state, without the network.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.data_processing import binance_api
+from src.data_processing.binance_api import get_default_market_data
+from src.utils.constants import DEFAULT_PRICE, DEFAULT_MOOD
+
+
+def test_default_market_data_for_other_coins():
+    data = get_default_market_data("solana-SOL")
+    assert data["price"] == DEFAULT_PRICE
+    assert data["mood"] == DEFAULT_MOOD
+    assert data["rsi_d1"] == 50.0
+
+
+def test_default_market_data_for_popular_coins():
+    assert get_default_market_data("BTC")["price"] > 0
+    assert get_default_market_data("ethereum-ETH")["price"] > 0
+
+
+class QueuedThread:
+    """Queues the thread target on start(); run_queued() then runs it in the test thread."""
+
+    queue = []
+
+    def __init__(self, target, args=(), **kwargs):
+        self.target, self.args = target, args
+
+    def start(self):
+        QueuedThread.queue.append(self)
+
+
+def run_queued():
+    while QueuedThread.queue:
+        thread = QueuedThread.queue.pop(0)
+        thread.target(*thread.args)
+
+
+@pytest.fixture
+def coin_state(monkeypatch):
+    """A fresh coin list state with no disk cache and queued background refreshes."""
+    QueuedThread.queue.clear()
+    state = binance_api.get_coin_list_state.__wrapped__()
+    monkeypatch.setattr(binance_api, "get_coin_list_state", lambda: state)
+    monkeypatch.setattr(binance_api, "load_cached_coin_list", lambda: None)
+    monkeypatch.setattr(binance_api, "threading", SimpleNamespace(Thread=QueuedThread, Lock=threading.Lock))
+    return state
+
+
+def test_coin_list_fetch_runs_outside_the_lock(coin_state, monkeypatch):
+    coins = [{"id": "binance-btc", "symbol": "btc", "binance_symbol": "BTCUSDT"}]
+
+    def fetch():
+        assert not coin_state["lock"].locked()
+        return coins
+
+    monkeypatch.setattr(binance_api, "fetch_coin_list", fetch)
+    assert binance_api.get_coin_list() is coins
+    assert coin_state["refreshing"] is False
+
+
+def test_failed_coin_list_fetch_serves_the_fallback_and_backs_off(coin_state, monkeypatch):
+    calls = []
+
+    def fetch():
+        calls.append(time.time())
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(binance_api, "fetch_coin_list", fetch)
+    assert binance_api.get_coin_list() is binance_api.FALLBACK_COINS
+    assert binance_api.get_coin_list() is binance_api.FALLBACK_COINS
+    assert len(calls) == 1
+    assert QueuedThread.queue == []
+    assert coin_state["retry_at"] > time.time()
+    assert coin_state["refreshing"] is False
+
+    # Once the retry time passes the next call refreshes in the background
+    coins = [{"id": "binance-btc", "symbol": "btc", "binance_symbol": "BTCUSDT"}]
+    monkeypatch.setattr(binance_api, "fetch_coin_list", lambda: coins)
+    coin_state["retry_at"] = 0.0
+    assert binance_api.get_coin_list() is binance_api.FALLBACK_COINS
+    assert coin_state["refreshing"] is True
+    run_queued()
+    assert binance_api.get_coin_list() is coins
+
+
+def test_empty_coin_list_counts_as_a_failed_fetch(coin_state, monkeypatch):
+    monkeypatch.setattr(binance_api, "fetch_coin_list", lambda: [])
+    assert binance_api.get_coin_list() is binance_api.FALLBACK_COINS
+    assert coin_state["retry_at"] > time.time()
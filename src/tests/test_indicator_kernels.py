@@ -0,0 +1,82 @@
+"""
+Numeric checks of the indicator kernels against pandas reference implementations.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analytics import indicator_kernels
+
+
+def _variants(name):
+    """Return the kernel and, when numba compiled it, its pure-Python function."""
+    kernel = getattr(indicator_kernels, name)
+    return [kernel, getattr(kernel, "py_func", kernel)]
+
+
+def _reference_rsi(close: np.ndarray, period: int = 14) -> pd.Series:
+    """Wilder's RSI with an SMA seed, written with pandas."""
+    delta = pd.Series(close).diff()
+    gain = delta.clip(lower=0).to_numpy()
+    loss = (-delta).clip(lower=0).to_numpy()
+    avg_gain = np.full(close.size, np.nan)
+    avg_loss = np.full(close.size, np.nan)
+    avg_gain[period] = gain[1:period + 1].mean()
+    avg_loss[period] = loss[1:period + 1].mean()
+    for i in range(period + 1, close.size):
+        avg_gain[i] = (avg_gain[i - 1] * (period - 1) + gain[i]) / period
+        avg_loss[i] = (avg_loss[i - 1] * (period - 1) + loss[i]) / period
+    return pd.Series(100 - 100 / (1 + avg_gain / avg_loss))
+
+
+@pytest.fixture
+def close() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return 100 + np.cumsum(rng.normal(size=500))
+
+
+@pytest.mark.parametrize("ema_series", _variants("ema_series"))
+@pytest.mark.parametrize("span", [12, 26, 200])
+def test_ema_series_matches_pandas(ema_series, span, close):
+    expected = pd.Series(close).ewm(span=span, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ema_series(close, 2 / (span + 1)), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("rsi_series", _variants("rsi_series"))
+def test_rsi_series_matches_reference(rsi_series, close):
+    result = rsi_series(close, 14)
+    assert np.isnan(result[:14]).all()
+    np.testing.assert_allclose(result[14:], _reference_rsi(close).to_numpy()[14:], rtol=1e-10)
+
+
+@pytest.mark.parametrize("indicators_last", _variants("indicators_last"))
+def test_indicators_last_matches_pandas(indicators_last, close):
+    rsi, macd, macd_signal, ema_fast, ema_slow = indicators_last(close, 14, 12, 26, 9)
+
+    series = pd.Series(close)
+    expected_fast = series.ewm(span=12, adjust=False).mean()
+    expected_slow = series.ewm(span=26, adjust=False).mean()
+    expected_macd = expected_fast - expected_slow
+    # The signal line starts from 0 rather than the first MACD value, which is 0 anyway
+    expected_signal = expected_macd.ewm(span=9, adjust=False).mean()
+
+    assert rsi == pytest.approx(_reference_rsi(close).iat[-1], rel=1e-10)
+    assert ema_fast == pytest.approx(expected_fast.iat[-1], rel=1e-12)
+    assert ema_slow == pytest.approx(expected_slow.iat[-1], rel=1e-12)
+    assert macd == pytest.approx(expected_macd.iat[-1], rel=1e-9)
+    assert macd_signal == pytest.approx(expected_signal.iat[-1], rel=1e-9)
+
+
+@pytest.mark.parametrize("size", [15, 50, 500])
+def test_rsi_kernels_agree(size, close):
+    """The sidebar RSI and the chart RSI series must be the same indicator."""
+    prices = close[:size]
+    rsi_last = indicator_kernels.indicators_last(prices, 14, 12, 26, 9)[0]
+    assert indicator_kernels.rsi_series(prices, 14)[-1] == pytest.approx(rsi_last, rel=1e-12)
+
+
+def test_rsi_flat_prices_read_neutral():
+    flat = np.full(30, 42.0)
+    assert indicator_kernels.indicators_last(flat, 14, 12, 26, 9)[0] == 50.0
+    assert indicator_kernels.rsi_series(flat, 14)[-1] == 50.0
@@ -0,0 +1,36 @@
+"""
+Checks of the background market data prefetch.
+"""
+
+from src.data_processing import binance_api, market_data
+
+
+class RecordingExecutor:
+    """Records submitted calls instead of running them."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args):
+        self.calls.append((fn, args))
+
+
+def test_prefetch_warms_rest_klines_without_opening_streams(monkeypatch):
+    executor = RecordingExecutor()
+    monkeypatch.setattr(market_data, "get_market_data_executor", lambda: executor)
+
+    market_data.prefetch_top_coins.__wrapped__(("BTCUSDT", "ETHUSDT"))
+
+    functions = [fn for fn, _ in executor.calls]
+    assert binance_api.get_live_klines not in functions
+    assert functions.count(market_data.get_binance_klines) == 4
+    assert (market_data.get_binance_24h_stats, (["BTCUSDT", "ETHUSDT"],)) in executor.calls
+
+
+def test_prefetch_skips_stats_for_an_empty_coin_list(monkeypatch):
+    executor = RecordingExecutor()
+    monkeypatch.setattr(market_data, "get_market_data_executor", lambda: executor)
+
+    market_data.prefetch_top_coins.__wrapped__(())
+
+    assert executor.calls == []
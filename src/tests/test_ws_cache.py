@@ -0,0 +1,145 @@
+"""
+Checks of how kline stream events are merged into the live buffers, and of when
+a stream thread stops.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.data_processing import ws_cache
+
+KEY = ("btcusdt", "1h")
+
+
+def _kline(open_time: int, close: str = "100.0") -> list:
+    """A kline row in REST column order."""
+    return [open_time, "99.0", "101.0", "98.0", close, "5.0", open_time + 59, "500.0", 10, "2.0", "200.0", "0"]
+
+
+def _event(open_time: int, close: str = "100.0") -> dict:
+    """A stream event carrying the same kline as _kline."""
+    row = _kline(open_time, close)
+    return {"e": "kline", "k": dict(zip("tohlcvTqnVQB", row))}
+
+
+@pytest.fixture(autouse=True)
+def buffer():
+    """Seed a three candle buffer for KEY and clean up all buffers afterwards."""
+    ws_cache.kline_cache[KEY] = [_kline(0), _kline(60), _kline(120)]
+    ws_cache.kline_cache_size[KEY] = 3
+    ws_cache.kline_last_update[KEY] = 0.0
+    yield ws_cache.kline_cache[KEY]
+    ws_cache._drop_stream(KEY)
+    ws_cache.kline_cache.clear()
+    ws_cache.kline_cache_size.clear()
+    ws_cache.kline_last_update.clear()
+
+
+def test_update_to_the_open_candle_replaces_it(buffer):
+    ws_cache._apply_kline_event(KEY, _event(120, close="105.0"))
+    assert len(buffer) == 3
+    assert buffer[-1] == _kline(120, close="105.0")
+    assert ws_cache.kline_last_update[KEY] > 0
+
+
+def test_new_candle_is_appended_and_the_buffer_trimmed(buffer):
+    ws_cache._apply_kline_event(KEY, _event(180))
+    assert [k[0] for k in buffer] == [60, 120, 180]
+    assert buffer[-1] == _kline(180)
+
+
+def test_older_candle_is_ignored(buffer):
+    ws_cache._apply_kline_event(KEY, _event(60, close="1.0"))
+    assert buffer == [_kline(0), _kline(60), _kline(120)]
+
+
+def test_empty_buffer_takes_the_first_candle():
+    ws_cache.kline_cache[KEY] = []
+    ws_cache._apply_kline_event(KEY, _event(0))
+    assert ws_cache.kline_cache[KEY] == [_kline(0)]
+
+
+def test_unknown_stream_is_ignored():
+    ws_cache._apply_kline_event(("ethusdt", "1h"), _event(180))
+    assert ("ethusdt", "1h") not in ws_cache.kline_cache
+
+
+def test_event_without_kline_is_ignored(buffer):
+    ws_cache._apply_kline_event(KEY, {"e": "kline"})
+    assert buffer == [_kline(0), _kline(60), _kline(120)]
+    assert ws_cache.kline_last_update[KEY] == 0.0
+
+
+class FakeWebSocketApp:
+    """Stands in for websocket.WebSocketApp; ``script`` plays one connection attempt."""
+
+    runs = 0
+
+    def __init__(self, url, script, **callbacks):
+        self.script = script
+        self.callbacks = callbacks
+        self.closed = False
+
+    def run_forever(self, **kwargs):
+        FakeWebSocketApp.runs += 1
+        self.script(self)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def run_stream(monkeypatch):
+    """Run _run_ws for KEY in the test thread with a scripted fake connection."""
+    def run(script, last_read=None):
+        FakeWebSocketApp.runs = 0
+        fake = SimpleNamespace(WebSocketApp=lambda url, **kw: FakeWebSocketApp(url, script, **kw))
+        monkeypatch.setattr(ws_cache, "websocket", fake)
+        monkeypatch.setattr(ws_cache, "KLINE_STREAM_RETRY_DELAY", 0)
+        ws_cache.kline_streams[KEY] = threading.current_thread()
+        ws_cache.kline_last_read[KEY] = time.time() if last_read is None else last_read
+        ws_cache._run_ws(KEY)
+        return FakeWebSocketApp.runs
+    return run
+
+
+def test_stream_that_never_connects_gives_up(run_stream):
+    def refused(app):
+        app.callbacks["on_error"](app, ConnectionRefusedError("refused"))
+
+    assert run_stream(refused) == ws_cache.KLINE_STREAM_MAX_RETRIES
+    assert KEY not in ws_cache.kline_streams
+    assert KEY not in ws_cache.kline_cache
+
+
+def test_stream_read_long_ago_does_not_connect(run_stream):
+    assert run_stream(lambda app: None, last_read=time.time() - ws_cache.KLINE_STREAM_IDLE_TIMEOUT - 1) == 0
+    assert KEY not in ws_cache.kline_streams
+
+
+def test_quiet_stream_is_closed_on_pong_once_idle(run_stream):
+    apps = []
+
+    def goes_idle(app):
+        apps.append(app)
+        app.callbacks["on_open"](app)
+        ws_cache.kline_last_read[KEY] = 0.0
+        app.callbacks["on_pong"](app, b"")
+
+    assert run_stream(goes_idle) == 1
+    assert apps[0].closed
+    assert KEY not in ws_cache.kline_streams
+
+
+def test_dropped_connections_that_opened_keep_reconnecting(run_stream):
+    drops = ws_cache.KLINE_STREAM_MAX_RETRIES + 3
+
+    def drops_then_idle(app):
+        app.callbacks["on_open"](app)
+        if FakeWebSocketApp.runs == drops:
+            ws_cache.kline_last_read[KEY] = 0.0
+
+    assert run_stream(drops_then_idle) == drops
@@ -4,41 +4,44 @@ Analysis display UI components for the Crypto Analysis Pro Dashboard.
 
 import streamlit as st
 import pandas as pd
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 
-from src.utils.constants import TIMEFRAMES
+from src.utils.constants import TIMEFRAMES, CHART_MAX_CANDLES
+from src.data_processing.binance_api import get_shared_historical_klines
 from src.analytics.ai_analysis import extract_signal, enhance_ai_analysis, extract_price_targets
-from src.ui_components.charts import create_candlestick_chart
+from src.ui_components.charts import (
+    create_candlestick_chart, downsample_ohlcv, is_lightweight_chart_available, render_lightweight_chart
+)
 from src.ui_components.price_targets import display_price_targets_table
 from src.ui_components.trading_strategy import generate_trading_strategy
 
+# Line prefixes treated as existing bullet points
+BULLET_PREFIXES = ('•', '-', '*')
+
+@lru_cache(maxsize=256)
 def format_section_with_bullets(text: str) -> str:
-    """Format text as bullet points for better readability."""
+    """Format text as bullet points for better readability; memoized per text."""
     if not text or "no data" in text.lower():
         return text
     
+    # Single-line text becomes a single bullet, without building the line lists
+    if '\n' not in text:
+        line = text.strip()
+        if not line:
+            return "<ul class='bullet-list'></ul>"
+        if line.startswith(BULLET_PREFIXES):
+            line = line[1:].strip()
+        return f"<ul class='bullet-list'><li>{line}</li></ul>"
+    
     # Split by newlines and filter out empty lines
     lines = [line.strip() for line in text.split('\n') if line.strip()]
     
-    # Check if already has bullet points
-    has_bullets = any(line.startswith('•') or line.startswith('-') or line.startswith('*') for line in lines)
-    
-    if has_bullets:
-        # Already has bullet points, just ensure proper HTML
-        formatted_lines = []
-        for line in lines:
-            # Remove existing bullet if present and add our own
-            if line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                clean_line = line[1:].strip()
-                formatted_lines.append(f"<li>{clean_line}</li>")
-            else:
-                formatted_lines.append(f"<li>{line}</li>")
-        
-        return f"<ul class='bullet-list'>{''.join(formatted_lines)}</ul>"
-    else:
-        # No bullet points, add them
-        formatted_lines = [f"<li>{line}</li>" for line in lines]
-        return f"<ul class='bullet-list'>{''.join(formatted_lines)}</ul>"
+    # Replace any existing bullet with our own; lines without one are used as-is
+    items = "".join(
+        f"<li>{line[1:].strip() if line.startswith(BULLET_PREFIXES) else line}</li>" for line in lines
+    )
+    return f"<ul class='bullet-list'>{items}</ul>"
 
 def display_analysis(rec: str, rationale: str, factors: str, outlook: str, targets: str, 
                     tech_signal: str, stats: Dict[str, Any], hist_data: pd.DataFrame, 
@@ -48,14 +51,6 @@ def display_analysis(rec: str, rationale: str, factors: str, outlook: str, targe
     # Enhance the AI analysis for more confidence
     rec, rationale, factors, outlook, targets = enhance_ai_analysis(rec, rationale, factors, outlook, targets)
 
-    # Format text sections with bullet points
-    formatted_rationale = format_section_with_bullets(rationale)
-    formatted_factors = format_section_with_bullets(factors)
-    formatted_outlook = format_section_with_bullets(outlook)
-
-    # Keep targets in original format for price extraction
-    formatted_targets = format_section_with_bullets(targets) if targets != "No data" else targets
-
     # Create a stylish container for the analysis
     st.markdown("""
     <div style="background-color: #1E1E1E; border-radius: 0.75rem; padding: 1.5rem; margin: 1rem 0; border: 1px solid #333; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);">
@@ -88,30 +83,33 @@ def display_analysis(rec: str, rationale: str, factors: str, outlook: str, targe
 
     st.markdown('<div style="margin: 1.5rem 0;"></div>', unsafe_allow_html=True)
     
-    # Organize content in tabs for better navigation
+    # Organize content in tabs for better navigation; each section is formatted
+    # where it is rendered, and repeat texts come from the memoized formatter
     analysis_tab, factors_tab, outlook_tab, targets_tab = st.tabs(["Analysis", "Key Factors", "Outlook", "Price Targets"])
 
     with analysis_tab:
         st.markdown('<div style="background-color: #252525; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;">', unsafe_allow_html=True)
         st.markdown('<h4 style="color: #60A5FA; margin-bottom: 1rem;">Trading Rationale</h4>', unsafe_allow_html=True)
-        st.markdown(formatted_rationale, unsafe_allow_html=True)
+        st.markdown(format_section_with_bullets(rationale), unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
     with factors_tab:
         st.markdown('<div style="background-color: #252525; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;">', unsafe_allow_html=True)
         st.markdown('<h4 style="color: #60A5FA; margin-bottom: 1rem;">Key Market & Technical Factors</h4>', unsafe_allow_html=True)
-        st.markdown(formatted_factors, unsafe_allow_html=True)
+        st.markdown(format_section_with_bullets(factors), unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
     with outlook_tab:
         st.markdown('<div style="background-color: #252525; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;">', unsafe_allow_html=True)
         st.markdown('<h4 style="color: #60A5FA; margin-bottom: 1rem;">Market Outlook</h4>', unsafe_allow_html=True)
-        st.markdown(formatted_outlook, unsafe_allow_html=True)
+        st.markdown(format_section_with_bullets(outlook), unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
     with targets_tab:
         st.markdown('<div style="background-color: #252525; padding: 1rem; border-radius: 0.5rem; margin-top: 1rem;">', unsafe_allow_html=True)
         st.markdown('<h4 style="color: #60A5FA; margin-bottom: 1rem;">Price Targets & Support Levels</h4>', unsafe_allow_html=True)
+        # Keep targets in original format for price extraction
+        formatted_targets = format_section_with_bullets(targets) if targets != "No data" else targets
         st.markdown(formatted_targets, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
             
@@ -136,36 +134,8 @@ def display_analysis(rec: str, rationale: str, factors: str, outlook: str, targe
                 st.markdown('<div style="background-color: #1E1E1E; border-radius: 0.75rem; padding: 1.5rem; margin: 1.5rem 0; border: 1px solid #333; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);">', unsafe_allow_html=True)
                 st.markdown('<h3 style="margin-bottom: 1rem; color: #60A5FA;">Technical Analysis Chart</h3>', unsafe_allow_html=True)
 
-                # Timeframe selection
-                timeframe_options = list(TIMEFRAMES.keys())
-
-                # Build the HTML string for timeframe buttons with improved styling
-                buttons_html = []
-                for tf in timeframe_options:
-                    active_class = "active" if tf == timeframe else ""
-                    active_style = "background-color: #3B82F6; color: white;" if tf == timeframe else "background-color: #374151; color: #E5E7EB;"
-                    # Fix URL parameter handling
-                    button_html = f'<a href="?coin_query={coin_symbol.upper()}&timeframe={tf}" style="{active_style} margin-right: 0.5rem; padding: 0.5rem 1rem; border: none; border-radius: 0.25rem; cursor: pointer; font-weight: 500; transition: all 0.2s ease; text-decoration: none; display: inline-block;">{TIMEFRAMES[tf]["label"]}</a>'
-                    buttons_html.append(button_html)
-
-                st.markdown(
-                    f"""
-                    <div style="display: flex; flex-wrap: wrap; margin-bottom: 1rem;">
-                        {"".join(buttons_html)}
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-
-                if not hist_data.empty:
-                    with st.spinner("Generating candlestick chart..."):
-                        candlestick_fig = create_candlestick_chart(hist_data, price_data, current_price, coin_symbol, timeframe)
-                        if candlestick_fig:
-                            st.plotly_chart(candlestick_fig, use_container_width=True)
-                        else:
-                            st.warning("Unable to create candlestick chart due to insufficient data.")
-                else:
-                    st.warning("Historical price data is not available for this cryptocurrency.")
+                # Timeframe selection and chart rerun on their own, without the analysis above
+                render_chart_fragment(hist_data, price_data, current_price, coin_symbol, timeframe)
                 
                 # Close the chart container div
                 st.markdown('</div>', unsafe_allow_html=True)
@@ -182,3 +152,44 @@ def display_analysis(rec: str, rationale: str, factors: str, outlook: str, targe
             st.info("No price targets available for this cryptocurrency.")
     except Exception as e:
         st.error(f"Error processing price targets: {str(e)}")
+
+@st.fragment
+def render_chart_fragment(hist_data: pd.DataFrame, price_data: pd.DataFrame, current_price: float,
+                          coin_symbol: str, timeframe: str):
+    """Render the timeframe selector and candlestick chart as a fragment.
+    
+    Picking another timeframe reruns only this function, so the market data fetch and
+    AI analysis of the full page are skipped. Klines for other timeframes are fetched
+    on demand from the shared klines cache. The canvas-based Lightweight Charts
+    renderer is used when installed, with the Plotly figure as the fallback.
+    """
+    chart_timeframe = st.segmented_control(
+        "Timeframe",
+        list(TIMEFRAMES.keys()),
+        default=timeframe,
+        format_func=lambda tf: TIMEFRAMES[tf]["label"],
+        key=f"chart_timeframe_{coin_symbol}_{timeframe}",
+        label_visibility="collapsed"
+    ) or timeframe
+    
+    if chart_timeframe != timeframe:
+        hist_data = get_shared_historical_klines(
+            f"{coin_symbol.upper()}USDT",
+            TIMEFRAMES[chart_timeframe]["interval"],
+            TIMEFRAMES[chart_timeframe]["limit"]
+        )
+    
+    # Very long histories are merged into wider candles so the chart payload stays small
+    hist_data = downsample_ohlcv(hist_data, CHART_MAX_CANDLES)
+    
+    if not hist_data.empty and is_lightweight_chart_available():
+        render_lightweight_chart(hist_data, price_data, current_price, coin_symbol, chart_timeframe)
+    elif not hist_data.empty:
+        with st.spinner("Generating candlestick chart..."):
+            candlestick_fig = create_candlestick_chart(hist_data, price_data, current_price, coin_symbol, chart_timeframe)
+            if candlestick_fig:
+                st.plotly_chart(candlestick_fig, use_container_width=True)
+            else:
+                st.warning("Unable to create candlestick chart due to insufficient data.")
+    else:
+        st.warning("Historical price data is not available for this cryptocurrency.")
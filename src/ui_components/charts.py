@@ -4,18 +4,68 @@ Chart components for the Crypto Analysis Pro Dashboard.
 
 import pandas as pd
 import numpy as np
+import streamlit as st
 import plotly.graph_objects as go
+from numpy.lib.stride_tricks import sliding_window_view
 from plotly.subplots import make_subplots
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from src.utils.constants import TIMEFRAMES
+from src.utils.constants import TIMEFRAMES, CHART_CACHE_TTL
+
+try:
+    from streamlit_lightweight_charts import renderLightweightCharts
+except ImportError:  # the lightweight chart is optional; callers fall back to Plotly
+    renderLightweightCharts = None
+
+# Label and line color for each price level type drawn on the candlestick chart
+PRICE_LEVEL_STYLES = {
+    'support': ("Support", '#10B981'),
+    'resistance': ("Resistance", '#EF4444')
+}
 
 def create_candlestick_chart(historical_data: pd.DataFrame, price_data: pd.DataFrame, current_price: float, 
                             coin_symbol: str, timeframe: str) -> Optional[go.Figure]:
-    """Create an interactive candlestick chart with technical indicators."""
+    """Create an interactive candlestick chart with technical indicators.
+    
+    The figure is cached on a fingerprint of the data (last candle, row count, columns
+    and price levels) so Streamlit never hashes the DataFrames themselves.
+    """
     if historical_data.empty:
         return None
     
+    data_key, levels_key = _chart_cache_keys(historical_data, price_data)
+    return _cached_candlestick_chart(
+        data_key, levels_key, current_price, coin_symbol, timeframe, historical_data, price_data
+    )
+
+def _chart_cache_keys(historical_data: pd.DataFrame, price_data: pd.DataFrame) -> Tuple[Tuple, Tuple]:
+    """Fingerprint the chart inputs for the chart caches."""
+    # The still-forming candle keeps its open time, so its close is part of the key
+    data_key = (
+        int(historical_data.index[-1].value),
+        len(historical_data),
+        float(historical_data['close'].iloc[-1]),
+        tuple(historical_data.columns)
+    )
+    levels_key = () if price_data.empty else tuple(
+        zip(price_data['price'].tolist(), price_data['confidence'].tolist(), price_data['type'].tolist())
+    )
+    return data_key, levels_key
+
+@st.cache_data(ttl=CHART_CACHE_TTL, max_entries=32, show_spinner=False)
+def _cached_candlestick_chart(data_key: Tuple, levels_key: Tuple, current_price: float, coin_symbol: str,
+                              timeframe: str, _historical_data: pd.DataFrame, _price_data: pd.DataFrame) -> go.Figure:
+    """Cached chart construction; the leading underscores keep the DataFrames out of the cache key."""
+    return _build_candlestick_chart(_historical_data, _price_data, current_price, coin_symbol, timeframe)
+
+def _build_candlestick_chart(historical_data: pd.DataFrame, price_data: pd.DataFrame, current_price: float,
+                             coin_symbol: str, timeframe: str) -> go.Figure:
+    """Build the candlestick figure with volume, RSI, EMA, Bollinger and MACD traces."""
+    # Every trace shares the same x values, and the column checks are repeated per indicator.
+    # Plotly takes NumPy arrays directly, skipping its Series conversion per trace
+    timestamps = historical_data.index.to_numpy()
+    columns = set(historical_data.columns)
+    
     # Create figure with secondary y-axis
     fig = make_subplots(
         rows=3, 
@@ -30,206 +80,144 @@ def create_candlestick_chart(historical_data: pd.DataFrame, price_data: pd.DataF
         )
     )
     
+    # Collect traces with their subplot rows, plus horizontal line shapes and labels,
+    # so the figure is validated in one batch instead of once per add_trace/add_hline
+    traces, rows = [], []
+    shapes, annotations = [], []
+    
     # Add candlestick chart
-    fig.add_trace(
-        go.Candlestick(
-            x=historical_data.index,
-            open=historical_data['open'],
-            high=historical_data['high'],
-            low=historical_data['low'],
-            close=historical_data['close'],
-            name="Price",
-            increasing_line_color='#10B981',
-            decreasing_line_color='#EF4444'
-        ),
-        row=1, col=1
-    )
+    traces.append(go.Candlestick(
+        x=timestamps,
+        open=historical_data['open'].to_numpy(),
+        high=historical_data['high'].to_numpy(),
+        low=historical_data['low'].to_numpy(),
+        close=historical_data['close'].to_numpy(),
+        name="Price",
+        increasing_line_color='#10B981',
+        decreasing_line_color='#EF4444'
+    ))
+    rows.append(1)
     
     # Add volume bar chart
-    colors = ['#10B981' if row['close'] >= row['open'] else '#EF4444' for _, row in historical_data.iterrows()]
-    
-    fig.add_trace(
-        go.Bar(
-            x=historical_data.index,
-            y=historical_data['volume'],
-            name="Volume",
-            marker_color=colors,
-            opacity=0.8
-        ),
-        row=2, col=1
+    colors = np.where(
+        historical_data['close'].to_numpy() >= historical_data['open'].to_numpy(), '#10B981', '#EF4444'
     )
     
+    traces.append(go.Bar(
+        x=timestamps,
+        y=historical_data['volume'].to_numpy(),
+        name="Volume",
+        marker_color=colors,
+        opacity=0.8
+    ))
+    rows.append(2)
+    
     # Add RSI if available
-    if 'rsi' in historical_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['rsi'],
-                name="RSI",
-                line=dict(color='#6366F1', width=1.5)
-            ),
-            row=3, col=1
-        )
+    if 'rsi' in columns:
+        traces.append(go.Scatter(
+            x=timestamps,
+            y=historical_data['rsi'].to_numpy(),
+            name="RSI",
+            line=dict(color='#6366F1', width=1.5)
+        ))
+        rows.append(3)
         
         # Add RSI reference lines
-        fig.add_hline(y=70, line_width=1, line_dash="dash", line_color="#EF4444", row=3, col=1)
-        fig.add_hline(y=30, line_width=1, line_dash="dash", line_color="#10B981", row=3, col=1)
+        shapes.append(_hline_shape(70, "#EF4444", "dash", row=3))
+        shapes.append(_hline_shape(30, "#10B981", "dash", row=3))
     
     # Add EMA lines if available
-    if 'ema12' in historical_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['ema12'],
-                name="EMA 12",
-                line=dict(color='#F59E0B', width=1.5)
-            ),
-            row=1, col=1
-        )
-    
-    if 'ema26' in historical_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['ema26'],
-                name="EMA 26",
-                line=dict(color='#3B82F6', width=1.5)
-            ),
-            row=1, col=1
-        )
-    
-    if 'ema50' in historical_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['ema50'],
-                name="EMA 50",
-                line=dict(color='#8B5CF6', width=1.5, dash='dot')
-            ),
-            row=1, col=1
-        )
-    
-    if 'ema200' in historical_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['ema200'],
-                name="EMA 200",
-                line=dict(color='#EC4899', width=1.5, dash='dot')
-            ),
-            row=1, col=1
-        )
+    for column, name, line in (
+        ('ema12', "EMA 12", dict(color='#F59E0B', width=1.5)),
+        ('ema26', "EMA 26", dict(color='#3B82F6', width=1.5)),
+        ('ema50', "EMA 50", dict(color='#8B5CF6', width=1.5, dash='dot')),
+        ('ema200', "EMA 200", dict(color='#EC4899', width=1.5, dash='dot'))
+    ):
+        if column in columns:
+            traces.append(go.Scatter(x=timestamps, y=historical_data[column].to_numpy(), name=name, line=line))
+            rows.append(1)
     
     # Add Bollinger Bands if available
-    if all(col in historical_data.columns for col in ['bollinger_upper', 'sma20', 'bollinger_lower']):
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['bollinger_upper'],
-                name="Upper Bollinger Band",
-                line=dict(color='rgba(99, 102, 241, 0.3)', width=1),
-                showlegend=True
-            ),
-            row=1, col=1
-        )
+    if all(col in columns for col in ['bollinger_upper', 'sma20', 'bollinger_lower']):
+        traces.append(go.Scatter(
+            x=timestamps,
+            y=historical_data['bollinger_upper'].to_numpy(),
+            name="Upper Bollinger Band",
+            line=dict(color='rgba(99, 102, 241, 0.3)', width=1),
+            showlegend=True
+        ))
         
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['sma20'],
-                name="SMA 20",
-                line=dict(color='rgba(99, 102, 241, 0.8)', width=1),
-                showlegend=True
-            ),
-            row=1, col=1
-        )
+        traces.append(go.Scatter(
+            x=timestamps,
+            y=historical_data['sma20'].to_numpy(),
+            name="SMA 20",
+            line=dict(color='rgba(99, 102, 241, 0.8)', width=1),
+            showlegend=True
+        ))
         
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['bollinger_lower'],
-                name="Lower Bollinger Band",
-                line=dict(color='rgba(99, 102, 241, 0.3)', width=1),
-                fill='tonexty',
-                fillcolor='rgba(99, 102, 241, 0.05)',
-                showlegend=True
-            ),
-            row=1, col=1
-        )
+        traces.append(go.Scatter(
+            x=timestamps,
+            y=historical_data['bollinger_lower'].to_numpy(),
+            name="Lower Bollinger Band",
+            line=dict(color='rgba(99, 102, 241, 0.3)', width=1),
+            fill='tonexty',
+            fillcolor='rgba(99, 102, 241, 0.05)',
+            showlegend=True
+        ))
+        rows.extend((1, 1, 1))
     
     # Add MACD if available
-    if all(col in historical_data.columns for col in ['macd', 'macd_signal']):
+    if all(col in columns for col in ['macd', 'macd_signal']):
         # Add MACD line
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['macd'],
-                name="MACD",
-                line=dict(color='#3B82F6', width=1.5)
-            ),
-            row=3, col=1
-        )
+        traces.append(go.Scatter(
+            x=timestamps,
+            y=historical_data['macd'].to_numpy(),
+            name="MACD",
+            line=dict(color='#3B82F6', width=1.5)
+        ))
         
         # Add MACD signal line
-        fig.add_trace(
-            go.Scatter(
-                x=historical_data.index,
-                y=historical_data['macd_signal'],
-                name="MACD Signal",
-                line=dict(color='#F59E0B', width=1.5)
-            ),
-            row=3, col=1
-        )
+        traces.append(go.Scatter(
+            x=timestamps,
+            y=historical_data['macd_signal'].to_numpy(),
+            name="MACD Signal",
+            line=dict(color='#F59E0B', width=1.5)
+        ))
+        rows.extend((3, 3))
         
         # Add MACD histogram
-        if 'macd_histogram' in historical_data.columns:
-            colors = ['#10B981' if val >= 0 else '#EF4444' for val in historical_data['macd_histogram']]
+        if 'macd_histogram' in columns:
+            colors = np.where(historical_data['macd_histogram'].to_numpy() >= 0, '#10B981', '#EF4444')
             
-            fig.add_trace(
-                go.Bar(
-                    x=historical_data.index,
-                    y=historical_data['macd_histogram'],
-                    name="MACD Histogram",
-                    marker_color=colors,
-                    opacity=0.8
-                ),
-                row=3, col=1
-            )
+            traces.append(go.Bar(
+                x=timestamps,
+                y=historical_data['macd_histogram'].to_numpy(),
+                name="MACD Histogram",
+                marker_color=colors,
+                opacity=0.8
+            ))
+            rows.append(3)
     
     # Add current price line
-    fig.add_hline(
-        y=current_price,
-        line_width=1,
-        line_dash="dash",
-        line_color="black",
-        annotation_text=f"Current: ${current_price:.2f}",
-        annotation_position="right",
-        row=1, col=1
-    )
+    shapes.append(_hline_shape(current_price, "black", "dash"))
+    annotations.append(_hline_label(current_price, f"Current: ${current_price:.2f}", "right"))
     
     # Add support and resistance levels from price_data
     if not price_data.empty:
-        for _, row in price_data.iterrows():
-            if row['type'].lower() == 'support':
-                fig.add_hline(
-                    y=row['price'],
-                    line_width=1,
-                    line_dash="dot",
-                    line_color="#10B981",
-                    annotation_text=f"Support: ${row['price']:.2f} ({row['confidence']}%)",
-                    annotation_position="left",
-                    row=1, col=1
-                )
-            elif row['type'].lower() == 'resistance':
-                fig.add_hline(
-                    y=row['price'],
-                    line_width=1,
-                    line_dash="dot",
-                    line_color="#EF4444",
-                    annotation_text=f"Resistance: ${row['price']:.2f} ({row['confidence']}%)",
-                    annotation_position="left",
-                    row=1, col=1
-                )
+        # Mask the drawable level types once, then walk plain lists instead of iterrows
+        types = price_data['type'].str.lower()
+        mask = types.isin(PRICE_LEVEL_STYLES)
+        for price, confidence, price_type in zip(
+            price_data['price'][mask].tolist(), price_data['confidence'][mask].tolist(), types[mask].tolist()
+        ):
+            label, color = PRICE_LEVEL_STYLES[price_type]
+            shapes.append(_hline_shape(price, color, "dot"))
+            annotations.append(_hline_label(price, f"{label}: ${price:.2f} ({confidence}%)", "left"))
+    
+    fig.add_traces(traces, rows=rows, cols=[1] * len(rows))
+    
+    # Subplot titles are annotations already, so append the line labels to them
+    fig.update_layout(shapes=shapes, annotations=list(fig.layout.annotations) + annotations)
     
     # Update layout
     fig.update_layout(
@@ -262,32 +250,183 @@ def create_candlestick_chart(historical_data: pd.DataFrame, price_data: pd.DataF
         ]
     )
     
-    # Add hover data
-    fig.update_layout(hovermode="x unified")
+    # Add hover data; a stable uirevision keeps the user's zoom and pan across reruns
+    # until the coin or timeframe changes
+    fig.update_layout(hovermode="x unified", uirevision=f"{coin_symbol}:{timeframe}")
     
     return fig
 
-def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
+def is_lightweight_chart_available() -> bool:
+    """Return True when the streamlit-lightweight-charts component is installed."""
+    return renderLightweightCharts is not None
+
+def render_lightweight_chart(historical_data: pd.DataFrame, price_data: pd.DataFrame, current_price: float,
+                             coin_symbol: str, timeframe: str) -> bool:
+    """Render the candlestick chart with TradingView Lightweight Charts.
+    
+    The canvas-based component ships a much smaller payload than the Plotly figure.
+    Returns False when there is nothing to draw.
+    """
+    if renderLightweightCharts is None or historical_data.empty:
+        return False
+    
+    data_key, levels_key = _chart_cache_keys(historical_data, price_data)
+    charts = _cached_lightweight_chart(data_key, levels_key, current_price, historical_data, price_data)
+    renderLightweightCharts(charts, key=f"lightweight_chart_{coin_symbol}_{timeframe}")
+    return True
+
+@st.cache_data(ttl=CHART_CACHE_TTL, max_entries=32, show_spinner=False)
+def _cached_lightweight_chart(data_key: Tuple, levels_key: Tuple, current_price: float,
+                              _historical_data: pd.DataFrame, _price_data: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Cached chart config; the leading underscores keep the DataFrames out of the cache key."""
+    return _build_lightweight_chart(_historical_data, _price_data, current_price)
+
+def _build_lightweight_chart(historical_data: pd.DataFrame, price_data: pd.DataFrame,
+                             current_price: float) -> List[Dict[str, Any]]:
+    """Build the Lightweight Charts config: candles, volume, EMA overlays and price lines."""
+    times = historical_data.index.to_numpy().astype('datetime64[s]').astype(np.int64).tolist()
+    open_prices = historical_data['open'].to_numpy()
+    close = historical_data['close'].to_numpy()
+    colors = np.where(close >= open_prices, '#10B981', '#EF4444').tolist()
+    
+    candles = [
+        {"time": t, "open": o, "high": h, "low": l, "close": c}
+        for t, o, h, l, c in zip(
+            times, open_prices.tolist(), historical_data['high'].tolist(), historical_data['low'].tolist(), close.tolist()
+        )
+    ]
+    volume = [
+        {"time": t, "value": v, "color": color}
+        for t, v, color in zip(times, historical_data['volume'].tolist(), colors)
+    ]
+    
+    # Current price and support/resistance levels as price lines on the candle series
+    price_lines = [{
+        "price": current_price, "color": "black", "lineWidth": 1, "lineStyle": 2,
+        "axisLabelVisible": True, "title": "Current"
+    }]
+    if not price_data.empty:
+        types = price_data['type'].str.lower()
+        mask = types.isin(PRICE_LEVEL_STYLES)
+        for price, price_type in zip(price_data['price'][mask].tolist(), types[mask].tolist()):
+            label, color = PRICE_LEVEL_STYLES[price_type]
+            price_lines.append({
+                "price": price, "color": color, "lineWidth": 1, "lineStyle": 1,
+                "axisLabelVisible": True, "title": label
+            })
+    
+    series = [
+        {
+            "type": "Candlestick",
+            "data": candles,
+            "options": {
+                "upColor": '#10B981', "downColor": '#EF4444', "borderVisible": False,
+                "wickUpColor": '#10B981', "wickDownColor": '#EF4444'
+            },
+            "priceLines": price_lines
+        },
+        {
+            "type": "Histogram",
+            "data": volume,
+            "options": {"priceFormat": {"type": "volume"}, "priceScaleId": ""},
+            "priceScale": {"scaleMargins": {"top": 0.8, "bottom": 0}}
+        }
+    ]
+    
+    # EMA overlays when the indicator columns are present
+    for column, color in (('ema12', '#F59E0B'), ('ema26', '#3B82F6'), ('ema50', '#8B5CF6'), ('ema200', '#EC4899')):
+        if column in historical_data.columns:
+            values = historical_data[column].to_numpy()
+            valid = ~np.isnan(values)
+            series.append({
+                "type": "Line",
+                "data": [
+                    {"time": t, "value": v}
+                    for t, v in zip(np.asarray(times)[valid].tolist(), values[valid].tolist())
+                ],
+                "options": {"color": color, "lineWidth": 1}
+            })
+    
+    return [{
+        "chart": {
+            "height": 500,
+            "layout": {"background": {"type": "solid", "color": "white"}, "textColor": "#374151"},
+            "grid": {"vertLines": {"color": "#F3F4F6"}, "horzLines": {"color": "#F3F4F6"}},
+            "timeScale": {"timeVisible": True, "secondsVisible": False}
+        },
+        "series": series
+    }]
+
+def _hline_shape(y: float, color: str, dash: str, row: int = 1) -> Dict[str, Any]:
+    """Full-width horizontal line on a subplot row, as fig.add_hline would draw it."""
+    axis = "" if row == 1 else str(row)
+    return dict(
+        type="line", xref=f"x{axis} domain", x0=0, x1=1, yref=f"y{axis}", y0=y, y1=y,
+        line=dict(color=color, dash=dash, width=1)
+    )
+
+def _hline_label(y: float, text: str, position: str) -> Dict[str, Any]:
+    """Label placed outside the left or right edge of the price subplot at height y."""
+    return dict(
+        text=text, showarrow=False, xref="x domain", x=0 if position == "left" else 1,
+        xanchor="right" if position == "left" else "left", yref="y", y=y, yanchor="middle"
+    )
+
+def downsample_ohlcv(historical_data: pd.DataFrame, max_candles: int) -> pd.DataFrame:
+    """Merge consecutive candles so at most max_candles remain.
+    
+    Each bucket keeps the first open, highest high, lowest low, last close and summed
+    volume, so the merged candles still cover the full price range.
+    """
+    n = len(historical_data)
+    if n <= max_candles:
+        return historical_data
+    
+    starts = np.arange(0, n, -(-n // max_candles))
+    ends = np.append(starts[1:], n) - 1
+    return pd.DataFrame(
+        {
+            'open': historical_data['open'].to_numpy()[starts],
+            'high': np.maximum.reduceat(historical_data['high'].to_numpy(), starts),
+            'low': np.minimum.reduceat(historical_data['low'].to_numpy(), starts),
+            'close': historical_data['close'].to_numpy()[ends],
+            'volume': np.add.reduceat(historical_data['volume'].to_numpy(), starts)
+        },
+        index=historical_data.index[starts]
+    )
+
+def rolling_mean_std(values: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and sample standard deviation, NaN-padded like pandas."""
+    mean = np.full(values.shape[0], np.nan)
+    std = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window:
+        windows = sliding_window_view(values, window)
+        mean[window - 1:] = windows.mean(axis=1)
+        std[window - 1:] = windows.std(axis=1, ddof=1)
+    return mean, std
+
+def display_volume_analysis(open_prices: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                            timestamps: np.ndarray, symbol: str):
     """Display volume analysis with trend detection and anomaly highlighting."""
-    if historical_data.empty:
+    if volume.size == 0:
         st.warning("No historical data available for volume analysis.")
         return
     
-    # Create a copy of the data for analysis
-    volume_data = historical_data.copy()
-    
     # Calculate volume metrics
-    volume_data['volume_sma20'] = volume_data['volume'].rolling(window=20).mean()
-    volume_data['volume_std20'] = volume_data['volume'].rolling(window=20).std()
+    volume_sma20, volume_std20 = rolling_mean_std(volume, 20)
     
     # Detect volume spikes (more than 2 standard deviations above the mean)
-    volume_data['volume_spike'] = volume_data['volume'] > (volume_data['volume_sma20'] + 2 * volume_data['volume_std20'])
+    spike_threshold = volume_sma20 + 2 * volume_std20
+    volume_spike = volume > spike_threshold
     
-    # Calculate volume trend (ratio of current volume to 20-day SMA)
-    volume_data['volume_trend'] = volume_data['volume'] / volume_data['volume_sma20']
-    
-    # Calculate daily volume change
-    volume_data['volume_change'] = volume_data['volume'].pct_change() * 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Calculate volume trend (ratio of current volume to 20-day SMA)
+        volume_trend = volume / volume_sma20
+        
+        # Calculate daily volume change
+        volume_change = np.empty_like(volume)
+        volume_change[0] = np.nan
+        volume_change[1:] = (volume[1:] / volume[:-1] - 1) * 100
     
     # Create subplots
     fig = make_subplots(
@@ -303,17 +442,15 @@ def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
     )
     
     # Add volume bars
-    colors = ['#10B981' if row['close'] >= row['open'] else '#EF4444' for _, row in volume_data.iterrows()]
-    
-    # Highlight volume spikes with different color
-    for i, is_spike in enumerate(volume_data['volume_spike']):
-        if is_spike:
-            colors[i] = '#8B5CF6'  # Purple for spikes
+    # Purple highlights volume spikes, otherwise green/red by candle direction
+    colors = np.where(
+        volume_spike, '#8B5CF6', np.where(close >= open_prices, '#10B981', '#EF4444')
+    ).tolist()
     
     fig.add_trace(
         go.Bar(
-            x=volume_data.index,
-            y=volume_data['volume'],
+            x=timestamps,
+            y=volume,
             name="Volume",
             marker_color=colors,
             opacity=0.8
@@ -324,8 +461,8 @@ def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
     # Add volume SMA
     fig.add_trace(
         go.Scatter(
-            x=volume_data.index,
-            y=volume_data['volume_sma20'],
+            x=timestamps,
+            y=volume_sma20,
             name="20-day SMA",
             line=dict(color='#3B82F6', width=2)
         ),
@@ -335,8 +472,8 @@ def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
     # Add upper threshold for spike detection
     fig.add_trace(
         go.Scatter(
-            x=volume_data.index,
-            y=volume_data['volume_sma20'] + 2 * volume_data['volume_std20'],
+            x=timestamps,
+            y=spike_threshold,
             name="Spike Threshold",
             line=dict(color='#8B5CF6', width=1, dash='dot')
         ),
@@ -344,12 +481,12 @@ def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
     )
     
     # Add volume change percentage
-    colors_change = ['#10B981' if val >= 0 else '#EF4444' for val in volume_data['volume_change']]
+    colors_change = np.where(volume_change >= 0, '#10B981', '#EF4444').tolist()
     
     fig.add_trace(
         go.Bar(
-            x=volume_data.index,
-            y=volume_data['volume_change'],
+            x=timestamps,
+            y=volume_change,
             name="Volume Change %",
             marker_color=colors_change,
             opacity=0.8
@@ -388,20 +525,21 @@ def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
     fig.update_layout(hovermode="x unified")
     
     # Show the figure
-    import streamlit as st
     st.plotly_chart(fig, use_container_width=True)
     
     # Display volume statistics
     col1, col2, col3 = st.columns(3)
     
     # Calculate statistics
-    avg_volume = volume_data['volume'].mean()
-    max_volume = volume_data['volume'].max()
-    max_volume_date = volume_data.loc[volume_data['volume'].idxmax()].name.strftime('%Y-%m-%d')
-    spike_count = volume_data['volume_spike'].sum()
+    avg_volume = volume.mean()
+    max_volume = volume.max()
+    max_volume_date = pd.Timestamp(timestamps[volume.argmax()]).strftime('%Y-%m-%d')
+    spike_count = int(volume_spike.sum())
     
     # Recent volume trend
-    recent_trend = volume_data['volume_trend'].iloc[-5:].mean()
+    recent = volume_trend[-5:]
+    recent = recent[~np.isnan(recent)]
+    recent_trend = recent.mean() if recent.size else np.nan
     if recent_trend > 1.5:
         trend_text = "Strongly Increasing"
         trend_color = "#10B981"
@@ -448,19 +586,15 @@ def display_volume_analysis(historical_data: pd.DataFrame, symbol: str):
     if spike_count > 0:
         st.markdown("### Volume Anomalies")
         
-        # Get dates with volume spikes
-        spike_dates = volume_data[volume_data['volume_spike']].index
-        
         # Create a table with spike information
         spike_data = []
-        for date in spike_dates:
-            row = volume_data.loc[date]
+        for i in np.flatnonzero(volume_spike):
             spike_data.append({
-                "Date": date.strftime('%Y-%m-%d'),
-                "Volume": f"{row['volume']:,.0f}",
-                "vs Average": f"{row['volume'] / row['volume_sma20']:.2f}x",
-                "Price Change": f"{(row['close'] - row['open']) / row['open'] * 100:.2f}%",
-                "Close Price": f"${row['close']:.2f}"
+                "Date": pd.Timestamp(timestamps[i]).strftime('%Y-%m-%d'),
+                "Volume": f"{volume[i]:,.0f}",
+                "vs Average": f"{volume_trend[i]:.2f}x",
+                "Price Change": f"{(close[i] - open_prices[i]) / open_prices[i] * 100:.2f}%",
+                "Close Price": f"${close[i]:.2f}"
             })
         
         # Convert to DataFrame for display
@@ -3,11 +3,38 @@ Market summary UI components for the Crypto Analysis Pro Dashboard.
 """
 
 import streamlit as st
+from datetime import datetime
 from typing import Dict, Any
 
 from src.utils.formatting import format_price, format_large_number
 
-def display_market_summary(stats: Dict[str, Any], symbol: str, update_time: str):
+# (color, icon, background) for a falling, flat and rising price, indexed by the sign of the change + 1
+PRICE_CHANGE_STYLES = (
+    ("#EF4444", "↘", "rgba(239, 68, 68, 0.2)"),  # Red
+    ("#F59E0B", "→", "rgba(245, 158, 11, 0.2)"),  # Amber for better visibility
+    ("#10B981", "↗", "rgba(16, 185, 129, 0.2)")  # Green
+)
+
+# (color, icon, background) per market mood and trading activity; other values use the neutral style
+MOOD_STYLES = {
+    "Bullish": ("#10B981", "📈", "rgba(16, 185, 129, 0.2)"),
+    "Bearish": ("#EF4444", "📉", "rgba(239, 68, 68, 0.2)")
+}
+NEUTRAL_MOOD_STYLE = ("#F59E0B", "📊", "rgba(245, 158, 11, 0.2)")
+
+BUZZ_STYLES = {
+    "High": ("#10B981", "🔥", "rgba(16, 185, 129, 0.2)"),
+    "Low": ("#EF4444", "❄️", "rgba(239, 68, 68, 0.2)")
+}
+NEUTRAL_BUZZ_STYLE = ("#F59E0B", "⚡", "rgba(245, 158, 11, 0.2)")
+
+# Shown next to the update time when the market data is a stale fallback
+STALE_BADGE_HTML = (
+    '<span style="margin-left: 0.5rem; padding: 0.125rem 0.5rem; border-radius: 0.25rem; '
+    'background-color: rgba(245, 158, 11, 0.2); color: #F59E0B;">Data may be outdated</span>'
+)
+
+def display_market_summary(stats: Dict[str, Any], symbol: str, update_ts: float):
     """Display market summary using native Streamlit components with improved UI."""
     # Market summary section with improved styling
     st.markdown("""
@@ -43,18 +70,7 @@ def display_market_summary(stats: Dict[str, Any], symbol: str, update_time: str)
         price_change_pct = stats.get('price_change_pct', 0)
         
         # Determine color based on price change
-        if price_change_pct > 0:
-            price_color = "#10B981"  # Green
-            price_icon = "↗"
-            price_bg = "rgba(16, 185, 129, 0.2)"
-        elif price_change_pct < 0:
-            price_color = "#EF4444"  # Red
-            price_icon = "↘"
-            price_bg = "rgba(239, 68, 68, 0.2)"
-        else:
-            price_color = "#F59E0B"  # Amber for better visibility
-            price_icon = "→"
-            price_bg = "rgba(245, 158, 11, 0.2)"
+        price_color, price_icon, price_bg = PRICE_CHANGE_STYLES[(price_change_pct > 0) - (price_change_pct < 0) + 1]
         
         # Display price with improved dark theme styling
         st.markdown(f"""
@@ -74,7 +90,8 @@ def display_market_summary(stats: Dict[str, Any], symbol: str, update_time: str)
         </div>
         <div style="font-size: 0.875rem; color: #94A3B8; display: flex; align-items: center;">
             <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="margin-right: 0.375rem;"><circle cx="12" cy="12" r="10"></circle><polyline points="12 6 12 12 16 14"></polyline></svg>
-            Last updated: {update_time}
+            Last updated: {datetime.fromtimestamp(update_ts).strftime('%Y-%m-%d %H:%M:%S')}
+            {STALE_BADGE_HTML if stats.get('stale') else ""}
         </div>
         """, unsafe_allow_html=True)
     
@@ -84,29 +101,25 @@ def display_market_summary(stats: Dict[str, Any], symbol: str, update_time: str)
         cap = stats.get('cap', 0)
         
         st.markdown(f"""
-        <div style="margin-bottom: 1rem; background-color: rgba(37, 37, 37, 0.9); padding: 1rem; border-radius: 0.5rem; transition: all 0.2s ease; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.375rem; display: flex; align-items: center;">
+        <div class="summary-stat">
+            <div class="summary-stat-label">
                 <span>Trading Volume (24h)</span>
-                <div class="tooltip" style="margin-left: 0.375rem;">
-                    <span style="color: #60A5FA; cursor: help; font-size: 0.75rem;">ℹ️</span>
+                <div class="tooltip">
+                    <span class="summary-info-icon">ℹ️</span>
                     <span class="tooltip-text">Total trading volume over the past 24 hours</span>
                 </div>
             </div>
-            <div style="font-size: 1.375rem; font-weight: 600; color: #F8FAFC;">
-                {format_large_number(volume, "$")}
-            </div>
+            <div class="summary-stat-value">{format_large_number(volume, "$")}</div>
         </div>
-        <div style="background-color: rgba(37, 37, 37, 0.9); padding: 1rem; border-radius: 0.5rem; transition: all 0.2s ease; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.375rem; display: flex; align-items: center;">
+        <div class="summary-stat">
+            <div class="summary-stat-label">
                 <span>Market Cap</span>
-                <div class="tooltip" style="margin-left: 0.375rem;">
-                    <span style="color: #60A5FA; cursor: help; font-size: 0.75rem;">ℹ️</span>
+                <div class="tooltip">
+                    <span class="summary-info-icon">ℹ️</span>
                     <span class="tooltip-text">Total market value of all coins in circulation</span>
                 </div>
             </div>
-            <div style="font-size: 1.375rem; font-weight: 600; color: #F8FAFC;">
-                {format_large_number(cap, "$")}
-            </div>
+            <div class="summary-stat-value">{format_large_number(cap, "$")}</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -115,57 +128,34 @@ def display_market_summary(stats: Dict[str, Any], symbol: str, update_time: str)
         mood = stats.get('mood', 'Neutral')
         buzz = stats.get('buzz', 'Moderate')
         
-        # Determine mood color and icon
-        if mood == "Bullish":
-            mood_color = "#10B981"  # Green
-            mood_icon = "📈"
-            mood_bg = "rgba(16, 185, 129, 0.2)"
-        elif mood == "Bearish":
-            mood_color = "#EF4444"  # Red
-            mood_icon = "📉"
-            mood_bg = "rgba(239, 68, 68, 0.2)"
-        else:
-            mood_color = "#F59E0B"  # Amber
-            mood_icon = "📊"
-            mood_bg = "rgba(245, 158, 11, 0.2)"
-        
-        # Determine buzz color and icon
-        if buzz == "High":
-            buzz_color = "#10B981"  # Green
-            buzz_icon = "🔥"
-            buzz_bg = "rgba(16, 185, 129, 0.2)"
-        elif buzz == "Low":
-            buzz_color = "#EF4444"  # Red
-            buzz_icon = "❄️"
-            buzz_bg = "rgba(239, 68, 68, 0.2)"
-        else:
-            buzz_color = "#F59E0B"  # Amber
-            buzz_icon = "⚡"
-            buzz_bg = "rgba(245, 158, 11, 0.2)"
+        # Determine mood and buzz color and icon
+        mood_color, mood_icon, mood_bg = MOOD_STYLES.get(mood, NEUTRAL_MOOD_STYLE)
+        buzz_color, buzz_icon, buzz_bg = BUZZ_STYLES.get(buzz, NEUTRAL_BUZZ_STYLE)
         
+        # Static card styling lives in styles.css; only the values and badge colors are sent
         st.markdown(f"""
-        <div style="margin-bottom: 1rem; background-color: rgba(37, 37, 37, 0.9); padding: 1rem; border-radius: 0.5rem; transition: all 0.2s ease; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.375rem; display: flex; align-items: center;">
+        <div class="summary-stat">
+            <div class="summary-stat-label">
                 <span>Market Sentiment</span>
-                <div class="tooltip" style="margin-left: 0.375rem;">
-                    <span style="color: #60A5FA; cursor: help; font-size: 0.75rem;">ℹ️</span>
+                <div class="tooltip">
+                    <span class="summary-info-icon">ℹ️</span>
                     <span class="tooltip-text">Overall market mood based on technical and social indicators</span>
                 </div>
             </div>
-            <div style="font-size: 1.25rem; font-weight: 600; background-color: {mood_bg}; color: {mood_color}; padding: 0.375rem 0.75rem; border-radius: 0.375rem; display: inline-flex; align-items: center; gap: 0.5rem; transition: all 0.2s ease;">
+            <div class="summary-badge" style="background-color: {mood_bg}; color: {mood_color};">
                 <span>{mood_icon}</span>
                 <span>{mood}</span>
             </div>
         </div>
-        <div style="background-color: rgba(37, 37, 37, 0.9); padding: 1rem; border-radius: 0.5rem; transition: all 0.2s ease; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.375rem; display: flex; align-items: center;">
+        <div class="summary-stat">
+            <div class="summary-stat-label">
                 <span>Trading Activity</span>
-                <div class="tooltip" style="margin-left: 0.375rem;">
-                    <span style="color: #60A5FA; cursor: help; font-size: 0.75rem;">ℹ️</span>
+                <div class="tooltip">
+                    <span class="summary-info-icon">ℹ️</span>
                     <span class="tooltip-text">Current trading volume relative to historical averages</span>
                 </div>
             </div>
-            <div style="font-size: 1.25rem; font-weight: 600; background-color: {buzz_bg}; color: {buzz_color}; padding: 0.375rem 0.75rem; border-radius: 0.375rem; display: inline-flex; align-items: center; gap: 0.5rem; transition: all 0.2s ease;">
+            <div class="summary-badge" style="background-color: {buzz_bg}; color: {buzz_color};">
                 <span>{buzz_icon}</span>
                 <span>{buzz}</span>
             </div>
@@ -16,9 +16,10 @@ def display_price_targets_table(price_data: pd.DataFrame):
     # Create columns for layout
     col1, col2 = st.columns([1, 1])
     
-    # Filter data by type
-    support_data = price_data[price_data['type'].str.lower() == 'support']
-    resistance_data = price_data[price_data['type'].str.lower() == 'resistance']
+    # Filter data by type, lowercasing the column once
+    types = price_data['type'].str.lower()
+    support_data = price_data[types == 'support']
+    resistance_data = price_data[types == 'resistance']
     
     # Support levels
     with col1:
@@ -48,10 +49,12 @@ def display_price_targets_table(price_data: pd.DataFrame):
             """
             
             # Add rows
-            for _, row in support_data.iterrows():
+            for price_label, confidence, description in zip(
+                support_data['price_label'].tolist(), support_data['confidence'].tolist(), support_data['description'].tolist()
+            ):
                 table_html += f"""
                 <tr>
-                    <td style="font-weight: 600;">${row['price']:.4f}</td>
+                    <td style="font-weight: 600;">{price_label}</td>
                     <td>
                         <div style="
                             width: 100%;
@@ -60,15 +63,15 @@ def display_price_targets_table(price_data: pd.DataFrame):
                             height: 0.5rem;
                         ">
                             <div style="
-                                width: {row['confidence']}%;
+                                width: {confidence}%;
                                 background-color: #10B981;
                                 border-radius: 0.25rem;
                                 height: 0.5rem;
                             "></div>
                         </div>
-                        <div style="font-size: 0.75rem; text-align: right;">{row['confidence']}%</div>
+                        <div style="font-size: 0.75rem; text-align: right;">{confidence}%</div>
                     </td>
-                    <td>{row['description']}</td>
+                    <td>{description}</td>
                 </tr>
                 """
             
@@ -119,10 +122,12 @@ def display_price_targets_table(price_data: pd.DataFrame):
             """
             
             # Add rows
-            for _, row in resistance_data.iterrows():
+            for price_label, confidence, description in zip(
+                resistance_data['price_label'].tolist(), resistance_data['confidence'].tolist(), resistance_data['description'].tolist()
+            ):
                 table_html += f"""
                 <tr>
-                    <td style="font-weight: 600;">${row['price']:.4f}</td>
+                    <td style="font-weight: 600;">{price_label}</td>
                     <td>
                         <div style="
                             width: 100%;
@@ -131,15 +136,15 @@ def display_price_targets_table(price_data: pd.DataFrame):
                             height: 0.5rem;
                         ">
                             <div style="
-                                width: {row['confidence']}%;
+                                width: {confidence}%;
                                 background-color: #EF4444;
                                 border-radius: 0.25rem;
                                 height: 0.5rem;
                             "></div>
                         </div>
-                        <div style="font-size: 0.75rem; text-align: right;">{row['confidence']}%</div>
+                        <div style="font-size: 0.75rem; text-align: right;">{confidence}%</div>
                     </td>
-                    <td>{row['description']}</td>
+                    <td>{description}</td>
                 </tr>
                 """
             
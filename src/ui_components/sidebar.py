@@ -8,6 +8,13 @@ from typing import Dict, Any, List, Tuple
 
 from src.utils.constants import TIMEFRAMES
 
+# RGB components of the indicator colors, used for the translucent badge backgrounds
+BADGE_RGB = {
+    '#10B981': '16, 185, 129',
+    '#EF4444': '239, 68, 68',
+    '#F59E0B': '245, 158, 11'
+}
+
 def setup_sidebar(coins_list: List[Dict[str, str]]) -> Tuple[str, str]:
     """Set up sidebar with search functionality and timeframe selection."""
     with st.sidebar:
@@ -58,7 +65,7 @@ def setup_sidebar(coins_list: List[Dict[str, str]]) -> Tuple[str, str]:
 def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float]):
     """Display coin metrics in a dedicated container in the main area instead of sidebar."""
     # Create container with improved styling and fixed width
-    st.markdown("""
+    container_html = """
     <div style="position: relative; width: 320px; background: linear-gradient(135deg, rgba(30, 41, 59, 0.95), rgba(15, 23, 42, 0.95));
          border-radius: 0.75rem; padding: 1rem; margin: 0 0 1rem 0;
          border: 1px solid rgba(148, 163, 184, 0.2); box-shadow: 0 4px 12px rgba(0, 0, 0, 0.2);">
@@ -69,7 +76,7 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
                 <span class="tooltip-text">Key technical indicators for market analysis</span>
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
     
     # RSI with improved styling
     rsi = tech_indicators.get('rsi', 50)  # Default to neutral value
@@ -86,16 +93,16 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
     except Exception:
         rsi = 50  # Fallback to neutral on error
     
-    st.markdown(f"""
+    rsi_html = f"""
     <div style="background-color: #252525; padding: 0.75rem; border-radius: 0.5rem; margin-bottom: 0.75rem;">
         <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.25rem;">RSI (14)</div>
         <div style="display: flex; justify-content: space-between; align-items: center;">
             <span style="font-size: 1.25rem; font-weight: 600; color: #E5E7EB;">{rsi:.1f}</span>
-            <span style="font-size: 0.75rem; background-color: rgba({','.join(['245, 158, 11' if rsi_color == '#F59E0B' else '239, 68, 68' if rsi_color == '#EF4444' else '16, 185, 129'])}, 0.2); 
+            <span style="font-size: 0.75rem; background-color: rgba({BADGE_RGB[rsi_color]}, 0.2); 
                   color: {rsi_color}; padding: 0.25rem 0.5rem; border-radius: 0.25rem;">{rsi_text}</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
     
     # MACD with improved styling
     macd = tech_indicators.get('macd', 0)
@@ -113,17 +120,17 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
         macd_color = "#F59E0B"
         macd_text = "Neutral"
     
-    st.markdown(f"""
+    macd_html = f"""
     <div style="background-color: #252525; padding: 0.75rem; border-radius: 0.5rem; margin-bottom: 0.75rem;">
         <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.25rem;">MACD</div>
         <div style="font-size: 1.25rem; font-weight: 600; color: #E5E7EB; margin-bottom: 0.25rem;">{macd:.4f}</div>
         <div style="display: flex; justify-content: space-between; align-items: center;">
             <span style="font-size: 0.75rem; color: #94A3B8;">Signal: {macd_signal:.4f}</span>
-            <span style="font-size: 0.75rem; background-color: rgba({','.join(['16, 185, 129' if macd_color == '#10B981' else '239, 68, 68'])}, 0.2); 
+            <span style="font-size: 0.75rem; background-color: rgba({BADGE_RGB[macd_color]}, 0.2); 
                   color: {macd_color}; padding: 0.25rem 0.5rem; border-radius: 0.25rem;">{macd_text}</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
     
     # Bollinger Bands with improved styling
     bb_width = tech_indicators.get('bb_width', 0)
@@ -149,7 +156,7 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
         bb_color = "#F59E0B"  # Amber
         bb_text = "Middle of Bands"
     
-    st.markdown(f"""
+    bb_html = f"""
     <div style="background-color: #252525; padding: 0.75rem; border-radius: 0.5rem; margin-bottom: 0.75rem;">
         <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.5rem;">Bollinger Bands</div>
         <div style="height: 0.5rem; background-color: #333; border-radius: 0.25rem; margin-bottom: 0.5rem;">
@@ -157,11 +164,11 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
         </div>
         <div style="display: flex; justify-content: space-between; font-size: 0.75rem;">
             <span style="color: #94A3B8;">Width: {bb_width:.2f}</span>
-            <span style="background-color: rgba({','.join(['239, 68, 68' if bb_color == '#EF4444' else '16, 185, 129' if bb_color == '#10B981' else '245, 158, 11'])}, 0.2); 
+            <span style="background-color: rgba({BADGE_RGB[bb_color]}, 0.2); 
                   color: {bb_color}; padding: 0.25rem 0.5rem; border-radius: 0.25rem;">{bb_text}</span>
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
     
     # Moving Averages with improved styling
     ema50 = tech_indicators.get('ema50', 0)
@@ -177,10 +184,10 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
     price_vs_ema50 = (price / ema50 - 1) * 100 if ema50 > 0 else 0
     price_vs_ema200 = (price / ema200 - 1) * 100 if ema200 > 0 else 0
     
-    st.markdown(f"""
+    ma_html = f"""
     <div style="background-color: #252525; padding: 0.75rem; border-radius: 0.5rem; margin-bottom: 0.75rem;">
         <div style="font-size: 0.875rem; color: #94A3B8; margin-bottom: 0.5rem;">Moving Averages</div>
-        <div style="font-size: 0.875rem; margin-bottom: 0.5rem; background-color: rgba({','.join(['16, 185, 129' if ma_color == '#10B981' else '239, 68, 68'])}, 0.2); 
+        <div style="font-size: 0.875rem; margin-bottom: 0.5rem; background-color: rgba({BADGE_RGB[ma_color]}, 0.2); 
               color: {ma_color}; padding: 0.25rem 0.5rem; border-radius: 0.25rem; display: inline-block;">{ma_text}</div>
         <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.25rem;">
             <span style="font-size: 0.75rem; color: #94A3B8;">Price vs EMA50:</span>
@@ -194,4 +201,7 @@ def display_coin_metrics(stats: Dict[str, Any], tech_indicators: Dict[str, float
     
     <!-- Close the technical metrics container -->
     </div>
-    """, unsafe_allow_html=True)
+    """
+    
+    # Send the container and its cards as one element so the container wraps them
+    st.markdown(container_html + rsi_html + macd_html + bb_html + ma_html, unsafe_allow_html=True)
@@ -3,11 +3,35 @@ Trading strategy UI components for the Crypto Analysis Pro Dashboard.
 """
 
 import pandas as pd
-from typing import Dict, Any, List
+import numpy as np
+import streamlit as st
+from typing import Dict, Any, List, Tuple
+
+from src.utils.constants import CACHE_TTL
 
 def generate_trading_strategy(tech_signal: str, ai_signal: str, current_price: float, 
                              price_data: pd.DataFrame, stats: Dict[str, Any]) -> str:
-    """Generate a trading strategy based on signals and price targets."""
+    """Generate a trading strategy based on signals and price targets.
+    
+    Only the signals, price, levels and market mood affect the HTML, so the rendered
+    strategy is cached on those instead of being rebuilt on every rerun.
+    """
+    levels_key = () if price_data.empty else tuple(
+        zip(price_data['price'].tolist(), price_data['type'].tolist())
+    )
+    return _cached_trading_strategy(
+        tech_signal, ai_signal, current_price, levels_key, stats.get('mood', 'Neutral'), price_data
+    )
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=64, show_spinner=False)
+def _cached_trading_strategy(tech_signal: str, ai_signal: str, current_price: float, levels_key: Tuple,
+                             mood: str, _price_data: pd.DataFrame) -> str:
+    """Cached strategy rendering; the leading underscore keeps the DataFrame out of the cache key."""
+    return _build_trading_strategy(tech_signal, ai_signal, current_price, _price_data, {'mood': mood})
+
+def _build_trading_strategy(tech_signal: str, ai_signal: str, current_price: float,
+                            price_data: pd.DataFrame, stats: Dict[str, Any]) -> str:
+    """Build the strategy HTML from the combined signal and the price levels."""
     
     # Normalize signals
     tech_signal = tech_signal.lower()
@@ -37,31 +61,27 @@ def generate_trading_strategy(tech_signal: str, ai_signal: str, current_price: f
         overall_signal = "hold"
         confidence = "moderate"
     
-    # Extract support and resistance levels
-    support_levels = price_data[price_data['type'].str.lower() == 'support'].sort_values('price', ascending=False)
-    resistance_levels = price_data[price_data['type'].str.lower() == 'resistance'].sort_values('price')
-    
-    # Find closest support and resistance
-    closest_support = None
-    closest_resistance = None
+    # Extract support and resistance prices as sorted NumPy arrays
+    prices = price_data['price'].to_numpy(dtype=float)
+    types = price_data['type'].str.lower().to_numpy()
+    support_levels = np.sort(prices[types == 'support'])[::-1]
+    resistance_levels = np.sort(prices[types == 'resistance'])
     
-    if not support_levels.empty:
-        # Get supports below current price
-        supports_below = support_levels[support_levels['price'] < current_price]
-        if not supports_below.empty:
-            closest_support = supports_below.iloc[0]
+    # Find closest support below and resistance above the current price
+    supports_below = support_levels[support_levels < current_price]
+    resistances_above = resistance_levels[resistance_levels > current_price]
+    closest_support = float(supports_below[0]) if supports_below.size else None
+    closest_resistance = float(resistances_above[0]) if resistances_above.size else None
     
-    if not resistance_levels.empty:
-        # Get resistances above current price
-        resistances_above = resistance_levels[resistance_levels['price'] > current_price]
-        if not resistances_above.empty:
-            closest_resistance = resistances_above.iloc[0]
+    # Format the prices shared by the entry, exit and stop loss points once
+    price_str = f"${current_price:.4f}"
+    support_str = f"${closest_support:.4f}" if closest_support is not None else ""
     
     # Calculate risk-reward ratio if both support and resistance are available
     risk_reward_ratio = None
     if closest_support is not None and closest_resistance is not None:
-        potential_gain = closest_resistance['price'] - current_price
-        potential_loss = current_price - closest_support['price']
+        potential_gain = closest_resistance - current_price
+        potential_loss = current_price - closest_support
         
         if potential_loss > 0:  # Avoid division by zero
             risk_reward_ratio = potential_gain / potential_loss
@@ -142,9 +162,9 @@ def generate_trading_strategy(tech_signal: str, ai_signal: str, current_price: f
         """
         
         if closest_support is not None:
-            strategy_html += f" Consider buying at current price (${current_price:.4f}) or on pullbacks to support at ${closest_support['price']:.4f}."
+            strategy_html += f" Consider buying at current price ({price_str}) or on pullbacks to support at {support_str}."
         else:
-            strategy_html += f" Consider buying at current price (${current_price:.4f}) with appropriate stop loss."
+            strategy_html += f" Consider buying at current price ({price_str}) with appropriate stop loss."
         
         strategy_html += """
                 </div>
@@ -161,9 +181,9 @@ def generate_trading_strategy(tech_signal: str, ai_signal: str, current_price: f
         """
         
         if closest_support is not None:
-            strategy_html += f" Consider selling at current price (${current_price:.4f}). If holding, set stop loss below ${closest_support['price']:.4f}."
+            strategy_html += f" Consider selling at current price ({price_str}). If holding, set stop loss below {support_str}."
         else:
-            strategy_html += f" Consider selling at current price (${current_price:.4f}) to protect capital."
+            strategy_html += f" Consider selling at current price ({price_str}) to protect capital."
         
         strategy_html += """
                 </div>
@@ -179,16 +199,14 @@ def generate_trading_strategy(tech_signal: str, ai_signal: str, current_price: f
                     <strong>Take Profit Levels:</strong>
         """
         
-        if not resistance_levels.empty:
+        if resistance_levels.size:
             # Get top 2 resistance levels
-            top_resistances = resistance_levels.head(min(2, len(resistance_levels)))
-            resistance_texts = []
-            
-            for _, res in top_resistances.iterrows():
-                pct_gain = (res['price'] - current_price) / current_price * 100
-                resistance_texts.append(f"${res['price']:.4f} ({pct_gain:.1f}%)")
+            top_resistances = resistance_levels[:2]
+            pct_gains = (top_resistances - current_price) / current_price * 100
             
-            strategy_html += " " + " and ".join(resistance_texts)
+            strategy_html += " " + " and ".join(
+                f"${price:.4f} ({pct_gain:.1f}%)" for price, pct_gain in zip(top_resistances, pct_gains)
+            )
         else:
             # Default take profit suggestion
             strategy_html += f" Consider taking profits at 5-10% above entry price."
@@ -208,8 +226,8 @@ def generate_trading_strategy(tech_signal: str, ai_signal: str, current_price: f
         """
         
         if closest_support is not None:
-            pct_loss = (current_price - closest_support['price']) / current_price * 100
-            strategy_html += f" Set stop loss slightly below ${closest_support['price']:.4f} ({pct_loss:.1f}% from current price)."
+            pct_loss = (current_price - closest_support) / current_price * 100
+            strategy_html += f" Set stop loss slightly below {support_str} ({pct_loss:.1f}% from current price)."
         else:
             # Default stop loss suggestion
             strategy_html += f" Consider setting stop loss at 5-8% below entry price."
@@ -14,9 +14,23 @@ DEFAULT_MARKET_CAP = 0.0
 DEFAULT_MOOD = "Neutral"
 DEFAULT_BUZZ = "Moderate"
 DEFAULT_SIGNAL = "hold"
-CACHE_TTL = 300  # 5 minutes cache
+PRICE_CACHE_TTL = 60  # Short tier: prices, 24h tickers and klines move every minute
+CACHE_TTL = 300  # Normal tier: derived analysis (indicators, AI output, strategy)
+MARKET_DATA_STALE_TTL = 86400  # Serve the last good market data for up to 24 hours when Binance fails
+COIN_LIST_TTL = 3600  # Long tier: the coin list and listed pairs
+COIN_LIST_DISK_TTL = 86400  # Reuse the on-disk coin list for up to 24 hours
+COIN_LIST_RETRY_DELAY = 60  # Wait 1 minute before refetching the coin list after a failed fetch
+COIN_LIST_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "crypto_agent", "coins.pkl")
 MAX_COINS = 30   # Maximum coins to list
+PREFETCH_COINS = 10  # Top coins whose klines are warmed in the background
 BINANCE_BASE_URL = "https://api.binance.com"
+BINANCE_TIMEOUT = 10  # Seconds before a Binance REST request is abandoned
+BINANCE_WS_URL = "wss://stream.binance.com:9443"
+KLINE_STREAM_MAX_AGE = 60  # Ignore streamed klines when no update arrived for 1 minute
+KLINE_STREAM_MAX_STREAMS = 24  # Open kline streams; the least recently read one is closed beyond this
+KLINE_STREAM_IDLE_TIMEOUT = 600  # Close a kline stream nobody read for 10 minutes
+KLINE_STREAM_MAX_RETRIES = 5  # Give up on a kline stream after 5 connection attempts in a row fail
+KLINE_STREAM_RETRY_DELAY = 5  # Seconds to wait before reconnecting a dropped kline stream
 DEFAULT_COIN = "BTC"  # Default cryptocurrency
 DEFAULT_TIMEFRAME = "1D"  # Default timeframe
 
@@ -60,6 +74,17 @@ TIMEFRAMES = {
     }
 }
 
+# Length of each Binance kline interval in seconds
+INTERVAL_SECONDS = {
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400
+}
+INDICATOR_LOOKBACK = 50  # Candles needed for stable RSI/MACD values
+RERUN_SNAPSHOT_TTL = 60  # Reuse fetched data across widget reruns for up to 1 minute
+CHART_MAX_CANDLES = 2000  # Longer histories are merged into wider candles before charting
+CHART_CACHE_TTL = 120  # Reuse a built chart figure for up to 2 minutes
+
 # Technical indicator thresholds
 TECH_INDICATOR_THRESHOLDS = {
     "rsi": {
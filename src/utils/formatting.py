@@ -2,6 +2,9 @@
 Formatting utilities for the Crypto Analysis Pro Dashboard.
 """
 
+from functools import lru_cache
+
+@lru_cache(maxsize=2048)
 def format_price(price: float) -> str:
     """Format price with appropriate decimal places based on magnitude."""
     if price >= 1000:
@@ -15,6 +18,7 @@ def format_price(price: float) -> str:
     else:
         return f"${price:.8f}"
 
+@lru_cache(maxsize=2048)
 def format_large_number(num: float, prefix: str = "") -> str:
     """Format large numbers with K, M, B, T suffixes."""
     if num is None:
@@ -31,6 +35,7 @@ def format_large_number(num: float, prefix: str = "") -> str:
     else:
         return f"{prefix}{num:.2f}"
 
+@lru_cache(maxsize=2048)
 def format_percentage(pct: float) -> str:
     """Format percentage with appropriate sign and decimal places."""
     if pct > 0: